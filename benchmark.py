@@ -10,6 +10,7 @@ Note to self: do `python3 -m scalene small_benchmark.py`
 # BEGIN IMPORTS
 
 import random
+import tracemalloc
 import colortools as ct
 from os         import makedirs
 from benchtools import timed, timed_titled
@@ -79,6 +80,34 @@ def test_sizes():
         maze = grid(n)
     return
 
+#@run
+def test_lattice_memory():
+    class DictNode: # Former per-instance `__dict__` layout of `mazing.Node`
+        def __init__(self, x, y):
+            self.flag = None
+            self._coordinates = (x, y)
+            self._distance = float('inf')
+            self._alg_id = 0
+            self._edges = 0b0000
+    @timed
+    def object_grid(n):
+        return [[DictNode(x,y) for x in range(2**n)] for y in range(2**n)]
+    N = 10
+    for builder in [object_grid, grid]:
+        tracemalloc.start()
+        lattice = builder(N)
+        (_, peak) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{builder.__name__}({N}): {peak/4**N:.1f} bytes per cell")
+        del lattice
+    maze = grid(N)
+    tracemalloc.start()
+    nodes = timed_titled("all node views", list)(maze.nodes())
+    (_, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"node views: {peak/4**N:.1f} bytes per cell")
+    return
+
 #@run
 def test_builders():
     for builder in ALGORITHMS.values():
@@ -89,21 +118,53 @@ def test_builders():
 #@run
 def test_tree_pop():
     N = 10
-    maze = grid(N)
-    timed(maze.growing_tree)(
-        name_and_index_choice=(
-            "random tree",
-            (lambda mxi:random.randint(0,mxi)),
-        )
+    index_choices = [
+        ("backtracker", (lambda mxi: -1)),
+        ("prim", (lambda mxi: random.randint(0,mxi))),
+        ("tree_0.50", (lambda mxi:
+            -1 if random.random() < 0.50 else random.randint(0,mxi)
+        )),
+    ]
+    for (name, index_choice) in index_choices:
+        for fast_pop in [False, True]:
+            maze = grid(N)
+            timed_titled(f"{name} fast_pop={fast_pop}", maze.growing_tree)(
+                name_and_index_choice=(name, index_choice),
+                fast_pop=fast_pop,
+            )
+    return
+
+#@run
+def test_distances():
+    maze = Maze(1920,1080)
+    timed(maze.kruskal)()
+    timed(maze.compute_distances)()
+    timed_titled("multi-source", maze.compute_distances_from)(
+        [maze.node_at(0,0), maze.node_at(-1,-1), maze.node_at(960,540)]
     )
-    maze = grid(N)
-    timed(maze.growing_tree)(
-        name_index_choice=(
-            "random tree fast",
-            (lambda mxi:random.randint(0,mxi)),
-        ),
-        fast_pop=True,
+    maze.random_edges()
+    timed_titled("random edges", maze.compute_distances)()
+    return
+
+def distance_frame(maze):
+    maze.compute_distances()
+    return maze.generate_colorimage(
+        raster=maze.generate_raster(show_distances=True, wall_air_ratio=(1,2))
     )
+
+def backtracker_runner(maze, record_frame):
+    maze.backtracker(record_frame=record_frame)
+    return
+
+#@run
+def test_animation():
+    for parallel in [False, True]:
+        timed_titled(f"distance animation parallel={parallel}", Maze.generate_animation)(
+            64, 64, backtracker_runner,
+            image_generator=distance_frame,
+            frame_only=16,
+            parallel=parallel,
+        )
     return
 
 #@run
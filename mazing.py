@@ -14,8 +14,12 @@ Comprehensive list of public interface methods:
         * wilson
         * division
         * xdivision
+        * tiled
+        * eller
     + Modification algorithms.
         * make_braided
+    + Streaming.
+        * eller_rows (function)
 - Generating Strings.
     * str_block
     * str_block_half
@@ -31,22 +35,35 @@ Comprehensive list of public interface methods:
         * generate_raster
     + Images.
         * generate_image
+        * to_png, rows_to_png (staticmethod)
+        * to_tiles
         * generate_solutionimage
         * generate_colorimage
         * generate_algorithmimage
     + Animations.
         * generate_animation (staticmethod)
+        * FrameRenderer, AnimationWriter (class)
+        * MutationLog, MazeReplay (class)
 - Computations & Light Modifications.
     * set_entrance, set_exit
     * compute_solution
     * compute_distances
     * compute_branchdistances
     * compute_longest_path
+    * compute_diameters
+    * distance_between, path_between
+    + Solvers.
+        * bidirectional_bfs
+        * astar
 - 'Low-level.'
     + Magics.
         * __init__, __repr__
     + Parser.
         * from_repr (staticmethod)
+    + Binary data.
+        * to_bytes, from_bytes (staticmethod)
+        * to_file, from_file (staticmethod)
+        * rows_to_file (staticmethod)
     + Read-only properties.
         * width, height, solution
     + Other access.
@@ -65,8 +82,6 @@ NOTE - Ideas in Progress:
         + Median
         + Same Cell
         + Most distant
-- Solvers
-    * A* pathfinder
 - ETC Dreams
     * CHALLENGE doom; "░▒▓█.,-~:;=!*#$@"
     * curses maze navigator
@@ -76,12 +91,26 @@ NOTE - Ideas in Progress:
 
 # BEGIN IMPORTS
 
-import collections # deque, OrderedDict
+import array
+import bisect
+import collections # Counter, deque, OrderedDict
+import concurrent.futures # ProcessPoolExecutor
+import functools # lru_cache
+import hashlib
+import heapq
+import itertools # chain
+import mmap
+from multiprocessing import shared_memory
+import os
 import random
+import shutil
+import struct
+import sys # byteorder
 import time # strftime
+import zlib
 # FIXME: Hack so we don't crash "just" because we don't have image functionality.
 try:
-    from PIL import Image
+    from PIL import Image, GifImagePlugin
 except Exception as e:
     print("ERROR: {e}")
 
@@ -97,6 +126,9 @@ ALGORITHMS = collections.OrderedDict()
 _ALGORITHMS_EXP2_MAX = 15
 """Power of two determining the expected maximum number of maze algorithms."""
 
+SOLVERS = collections.OrderedDict()
+"""Public list of available maze solvers."""
+
 # Directions
 RIGHT = 0b0001
 UP    = 0b0010
@@ -105,6 +137,20 @@ DOWN  = 0b1000
 
 _INFINITY = float('inf')
 
+_EDGE_COUNTS = bytes(bin(edges).count('1') for edges in range(256))
+"""Number of edges (node degree) by edges bitmask."""
+
+# Binary maze files
+_FILE_MAGIC = b'MAZE'
+_FILE_VERSION = 1
+_FILE_HAS_ALGORITHMS = 0b0001
+_FILE_ALGORITHMS_RLE = 0b0010
+_FILE_HEADER = struct.Struct('<4sBBHIIIIII')
+"""Magic, version, flags, algorithm count, width, height, entrance, exit."""
+_LOW_NIBBLE  = bytes(b & 0xf for b in range(256))
+_HIGH_NIBBLE = bytes(b >> 4 for b in range(256))
+_TO_HIGH_NIBBLE = bytes((b & 0xf) << 4 for b in range(256))
+
 # END   CONSTANTS
 
 
@@ -115,6 +161,11 @@ def maze_algorithm(f):
     ALGORITHMS[f.__name__] = f
     return f
 
+def maze_solver(f):
+    """Maze solver decorator: add to SOLVERS."""
+    SOLVERS[f.__name__] = f
+    return f
+
 # END   DECORATORS
 
 
@@ -123,18 +174,32 @@ def maze_algorithm(f):
 class Node:
     """
     A class representing a rectangular grid cell / maze node.
+
+    Nodes do not hold any state themselves but are thin views created on demand
+    onto the flat arrays of the maze they belong to. Two views of the same cell
+    compare (and hash) equal.
     """
-    def __init__(self, x, y):
-        """Initialize a node by its grid coordinates."""
-        self.flag = None
+    __slots__ = ('_maze', '_coordinates', '_index')
+
+    def __init__(self, maze, x, y):
+        """Initialize a node view by its maze and grid coordinates."""
+        self._maze = maze
         self._coordinates = (x, y)
-        self._distance = _INFINITY
-        self._alg_id = 0
-        self._edges = 0b0000
+        self._index = y * maze._width + x
 
     def __repr__(self):
         return self._coordinates.__repr__()
 
+    def __eq__(self, other):
+        return (
+            isinstance(other, Node)
+            and self._index == other._index
+            and self._maze is other._maze
+        )
+
+    def __hash__(self):
+        return self._index
+
     @property
     def coordinates(self):
         """Location of node."""
@@ -145,6 +210,46 @@ class Node:
         """Distance of node to some target."""
         return self._distance
 
+    @property
+    def flag(self):
+        """Integer flag for algorithms to mark node with (0 if unset)."""
+        return self._maze._flags[self._index]
+
+    @flag.setter
+    def flag(self, value):
+        self._maze._flags[self._index] = value or 0
+
+    @property
+    def _distance(self):
+        distance = self._maze._distances[self._index]
+        return distance if distance >= 0 else _INFINITY
+
+    @_distance.setter
+    def _distance(self, value):
+        self._maze._distances[self._index] = -1 if value == _INFINITY else value
+
+    @property
+    def _alg_id(self):
+        return self._maze._alg_ids[self._index]
+
+    @_alg_id.setter
+    def _alg_id(self, value):
+        self._maze._set_alg_id(self._index, value)
+
+    @property
+    def _edges(self):
+        return self._maze._edges[self._index]
+
+    @_edges.setter
+    def _edges(self, value):
+        maze = self._maze
+        if maze._log is not None:
+            maze._log._record(self._index, maze._edges[self._index] ^ value, 0)
+        maze._edges[self._index] = value
+        maze._path_index = None
+        if maze._dirty is not None:
+            maze._dirty.add(self._index)
+
     def has_wall(self, direction):
         """Check whether there is a wall in some direction from the node."""
         return not (self._edges & direction)
@@ -191,19 +296,31 @@ class Maze:
             raise ValueError("Maze must have positive width and height")
         self._width  = width
         self._height = height
-        self._lattice = [[Node(x,y) for x in range(width)] for y in range(height)]
+        # Cell data lives in flat arrays indexed by `y*width + x`
+        cellcount = width * height
+        self._edges = array.array('B', [0]) * cellcount
+        self._alg_ids = array.array('H', [0]) * cellcount
+        self._distances = array.array('i', [-1]) * cellcount # -1 = infinity
+        self._flags = array.array('i', [0]) * cellcount
         self._solution_nodes = None
+        self._path_index = None # See `_build_path_index`
+        self._dirty = None # Changed cell indices, see `FrameRenderer`
+        self._log = None # See `MutationLog`
+        self.seed = None
         self.entrance = self.node_at(0,0)
         self.exit = self.node_at(-1,-1)
 
     def __repr__(self):
+        (w, edges, alg_ids) = (self._width, self._edges, self._alg_ids)
         string = (
             self.entrance.coordinates,
             self.exit.coordinates,
             [
                 [
-                    node._edges + (node._alg_id << 4) for node in row
-                ] for row in self._lattice
+                    e + (a << 4) for (e,a) in zip(
+                        edges[y*w:(y+1)*w], alg_ids[y*w:(y+1)*w]
+                    )
+                ] for y in range(self._height)
             ],
         ).__repr__()
         return string
@@ -232,9 +349,9 @@ class Maze:
             for x in range(maze.width): #   two loops for a long time - epic bug
                 assert (type(grid[y][x]) == int)
                 raw = grid[y][x]
-                node = maze.node_at(x,y)
-                node._edges  = raw % 0b10000
-                node._alg_id = raw // 0b10000
+                index = y*maze.width + x
+                maze._edges[index]   = raw % 0b10000
+                maze._alg_ids[index] = raw // 0b10000
         assert (type(entrance_coordinates) == tuple)
         assert (type(entrance_coordinates[0]) == int)
         assert (type(entrance_coordinates[1]) == int)
@@ -245,6 +362,241 @@ class Maze:
         maze.set_exit(*exit_coordinates)
         return maze
 
+    @staticmethod
+    def _pack_nibbles(values):
+        """Pack 4-bit values two per byte, even positions in the low nibble.
+
+        Args:
+            values (bytes-like): Values 0 <= value < 16.
+
+        Returns:
+            bytes: Packed values, len(values)/2 rounded up bytes long.
+        """
+        low = bytes(values[0::2])
+        high = bytes(values[1::2]).translate(_TO_HIGH_NIBBLE)
+        # Nibbles don't overlap, so we can combine them in one integer OR
+        packed = int.from_bytes(low,'little') | int.from_bytes(high,'little')
+        return packed.to_bytes(len(low),'little')
+
+    @staticmethod
+    def _unpack_nibbles(packed, row_length=None):
+        """Unpack bytes into 4-bit values, reverse of `_pack_nibbles`.
+
+        Args:
+            packed (bytes-like): Packed values.
+            row_length (int): Number of values per packed row, if the data
+                consists of consecutive packed rows (default is all values).
+
+        Returns:
+            bytearray: Unpacked values.
+        """
+        packed = bytes(packed)
+        values = bytearray(2*len(packed))
+        values[0::2] = packed.translate(_LOW_NIBBLE)
+        values[1::2] = packed.translate(_HIGH_NIBBLE)
+        if row_length is not None and row_length % 2:
+            # Drop padding nibble at the end of every row
+            del values[row_length::row_length+1]
+        return values
+
+    def to_bytes(self, with_algorithms=True, run_length=True):
+        """Produce a compact binary representation of the maze.
+
+        The data consists of a header (dimensions, entrance, exit and the names
+        of ALGORITHMS, each prefixed by its 16-bit length), followed by the
+        edges packed row by row with two nodes per byte, and optionally
+        followed by the algorithm ids of nodes.
+        Algorithm ids are stored as little endian 16-bit integers, either one
+        per node or as runs (all ids, then all 32-bit run lengths).
+
+        Args:
+            with_algorithms (bool): Whether to store algorithm ids of nodes
+                (default is True).
+            run_length (bool): Whether to run-length encode algorithm ids,
+                which usually form large contiguous regions (default is True).
+
+        Returns:
+            bytes: Binary data, see `from_bytes`.
+        """
+        (w, h) = (self.width, self.height)
+        names = [name.encode() for name in ALGORITHMS] if with_algorithms else []
+        flags = (
+            (_FILE_HAS_ALGORITHMS if with_algorithms else 0)
+            | (_FILE_ALGORITHMS_RLE if with_algorithms and run_length else 0)
+        )
+        parts = [_FILE_HEADER.pack(
+            _FILE_MAGIC,
+            _FILE_VERSION,
+            flags,
+            len(names),
+            w, h,
+            *self.entrance.coordinates,
+            *self.exit.coordinates,
+        )]
+        parts += [struct.pack('<H', len(name)) + name for name in names]
+        if w % 2 == 0: # Rows need no padding, pack all at once
+            parts.append(Maze._pack_nibbles(self._edges))
+        else:
+            parts += [Maze._pack_nibbles(self._edges[y*w:(y+1)*w]) for y in range(h)]
+        if with_algorithms:
+            if run_length:
+                runs = [(k, len(list(g))) for (k,g) in itertools.groupby(self._alg_ids)]
+                alg_ids = array.array('H', (k for (k,_) in runs))
+                run_lengths = array.array('I', (n for (_,n) in runs))
+                parts.append(struct.pack('<I', len(runs)))
+            else:
+                alg_ids = array.array('H', self._alg_ids)
+                run_lengths = array.array('I')
+            if sys.byteorder != 'little':
+                alg_ids.byteswap()
+                run_lengths.byteswap()
+            parts += [alg_ids.tobytes(), run_lengths.tobytes()]
+        return b''.join(parts)
+
+    @staticmethod
+    def from_bytes(data):
+        """Load a maze from binary data produced by `to_bytes`.
+
+        Algorithm ids are matched to the current ALGORITHMS by name;
+        unknown algorithms are mapped to 0.
+
+        Args:
+            data (bytes-like): Binary maze data.
+
+        Returns:
+            Maze: Corresponding maze object
+        """
+        if len(data) < _FILE_HEADER.size or data[:4] != _FILE_MAGIC:
+            raise ValueError("not maze data")
+        (
+            _, version, flags, name_count, w, h, *entrance_exit
+        ) = _FILE_HEADER.unpack_from(data)
+        if version != _FILE_VERSION:
+            raise ValueError(f"unsupported maze data version {version}")
+        if flags & ~(_FILE_HAS_ALGORITHMS | _FILE_ALGORITHMS_RLE):
+            raise ValueError(f"unsupported maze data flags {flags:#b}")
+        def check_size(size):
+            if len(data) < offset + size:
+                raise ValueError("truncated maze data")
+        offset = _FILE_HEADER.size
+        names = []
+        for _ in range(name_count):
+            check_size(2)
+            (length,) = struct.unpack_from('<H', data, offset)
+            check_size(2+length)
+            names.append(bytes(data[offset+2:offset+2+length]).decode())
+            offset += 2+length
+        # Check planes before allocating a maze of the claimed size
+        plane_size = h * ((w+1) // 2)
+        check_size(plane_size)
+        if flags & _FILE_HAS_ALGORITHMS and not flags & _FILE_ALGORITHMS_RLE:
+            check_size(plane_size + 2*w*h)
+        maze = Maze(w, h)
+        maze._edges = array.array('B', Maze._unpack_nibbles(
+            data[offset:offset+plane_size], row_length=w
+        ))
+        offset += plane_size
+        if flags & _FILE_HAS_ALGORITHMS:
+            if flags & _FILE_ALGORITHMS_RLE:
+                check_size(4)
+                (run_count,) = struct.unpack_from('<I', data, offset)
+                offset += 4
+                check_size(6*run_count)
+                run_ids = array.array('H', bytes(data[offset:offset+2*run_count]))
+                offset += 2*run_count
+                run_lengths = array.array('I', bytes(data[offset:offset+4*run_count]))
+                if sys.byteorder != 'little':
+                    run_ids.byteswap()
+                    run_lengths.byteswap()
+                if sum(run_lengths) != w*h:
+                    raise ValueError("algorithm runs don't cover maze")
+                alg_ids = array.array('H')
+                for (alg_id,run_length) in zip(run_ids,run_lengths):
+                    alg_ids += array.array('H', [alg_id]) * run_length
+            else:
+                alg_ids = array.array('H', bytes(data[offset:offset+2*w*h]))
+                if sys.byteorder != 'little':
+                    alg_ids.byteswap()
+            if names != list(ALGORITHMS)[:len(names)]:
+                ids = Maze._algorithm_name_to_id
+                table = [ids(name) if name in ALGORITHMS else 0 for name in names]
+                table += [0] * (max(alg_ids, default=0)+1 - len(table))
+                alg_ids = array.array('H', map(table.__getitem__, alg_ids))
+            maze._alg_ids = alg_ids
+        maze.set_entrance(*entrance_exit[:2])
+        maze.set_exit(*entrance_exit[2:])
+        return maze
+
+    def to_file(self, path, with_algorithms=True, run_length=True):
+        """Store the maze in a compact binary file, see `to_bytes`.
+
+        Args:
+            path (str): Location of file to write.
+            with_algorithms (bool): Whether to store algorithm ids of nodes
+                (default is True).
+            run_length (bool): Whether to run-length encode algorithm ids
+                (default is True).
+        """
+        with open(path,'wb') as file:
+            file.write(self.to_bytes(with_algorithms, run_length))
+        return
+
+    @staticmethod
+    def rows_to_file(path, width, height, rows, entrance_coordinates=None, exit_coordinates=None):
+        """Stream rows of edges into a binary maze file without a `Maze` object.
+
+        The file has the format of `to_file` (without algorithm ids), so it
+        can be loaded by `from_file`.
+
+        Args:
+            path (str): Location of file to write.
+            width, height (int): Positive integer dimensions of maze.
+            rows (iterable(bytes)): Rows of edges packed two nodes per byte,
+                e.g. from `eller_rows`.
+            entrance_coordinates, exit_coordinates (int,int): Coordinates of
+                entrance and exit (default is (0,0) and (width-1,height-1)).
+        """
+        if entrance_coordinates is None:
+            entrance_coordinates = (0,0)
+        if exit_coordinates is None:
+            exit_coordinates = (width-1,height-1)
+        row_size = (width+1) // 2
+        with open(path,'wb') as file:
+            file.write(_FILE_HEADER.pack(
+                _FILE_MAGIC,
+                _FILE_VERSION,
+                0,
+                0,
+                width, height,
+                *entrance_coordinates,
+                *exit_coordinates,
+            ))
+            row_count = 0
+            for row in rows:
+                if len(row) != row_size:
+                    raise ValueError(f"row {row_count} is not {row_size} bytes long")
+                file.write(row)
+                row_count += 1
+            if row_count != height:
+                raise ValueError(f"got {row_count} rows instead of {height}")
+        return
+
+    @staticmethod
+    def from_file(path):
+        """Load a maze from a binary file written by `to_file`.
+
+        The file is memory-mapped and its planes decoded in bulk.
+
+        Args:
+            path (str): Location of file to read.
+
+        Returns:
+            Maze: Corresponding maze object
+        """
+        with open(path,'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            maze = Maze.from_bytes(data)
+        return maze
+
     @property
     def width(self):
         """Width of the maze."""
@@ -287,10 +639,12 @@ class Maze:
             iter(Node): Iterator over nodes.
         """
         if area is None:
-            return (node for row in self._lattice for node in row)
+            (x0,y0,x1,y1) = (0,0,self.width-1,self.height-1)
         else:
             (x0,y0,x1,y1) = area
-            return (node for row in self._lattice[y0:y1+1] for node in row[x0:x1+1])
+        return (
+            Node(self,x,y) for y in range(y0,y1+1) for x in range(x0,x1+1)
+        )
 
     def edges(self, area=None):
         """Produce iterator over the edges of the maze.
@@ -303,46 +657,37 @@ class Maze:
         Returns:
             iter(tuple(Node,Node)): Iterator over 'edges'.
         """
-        edge_iterators = []
         if area is None:
-            rows = self._lattice
-            # Horizontal edges
-            for row in rows:
-                row_shifted_right = iter(row) ; next(row_shifted_right)
-                edge_iterators.append(zip(row,row_shifted_right))
-            # Vertical edges
-            rows_below = iter(rows) ; next(rows_below)
-            for row,row_below in zip(rows,rows_below):
-                edge_iterators.append(zip(row,row_below))
+            (x0,y0,x1,y1) = (0,0,self.width-1,self.height-1)
         else:
             (x0,y0,x1,y1) = area
-            edge_iterators = []
-            # Horizontal edges
-            rows_slice = self._lattice[y0:y1+1]
-            for row in rows_slice:
-                row_slice = row[x0:x1+1]
-                row_slice_right = row[x0+1:x1+1]
-                edges = zip(row_slice,row_slice_right)
-                edge_iterators.append(edges)
-            # Vertical edges
-            rows_slice_below = self._lattice[y0+1:y1+1]
-            for row,row_below in zip(rows_slice,rows_slice_below):
-                row_slice = row[x0:x1+1]
-                row_slice_below = row_below[x0:x1+1]
-                edges = zip(row_slice,row_slice_below)
-                edge_iterators.append(edges)
-        return (edge for itr in edge_iterators for edge in itr)
+        # Horizontal edges
+        horizontal_edges = (
+            (Node(self,x,y), Node(self,x+1,y))
+            for y in range(y0,y1+1) for x in range(x0,x1)
+        )
+        # Vertical edges
+        vertical_edges = (
+            (Node(self,x,y), Node(self,x,y+1))
+            for y in range(y0,y1) for x in range(x0,x1+1)
+        )
+        return itertools.chain(horizontal_edges, vertical_edges)
 
     def node_at(self, x, y):
         """Access node at those coordinates in the maze.
 
         Args:
             x, y (int): Coordinates with 0<=x<self.width && 0<=y<self.height
+                (negative values count from the end, as with lists).
 
         Returns:
             Node: Node object at position (x,y) in maze
         """
-        return self._lattice[y][x]
+        if x < 0: x += self._width
+        if y < 0: y += self._height
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            raise IndexError("node coordinates out of range")
+        return Node(self,x,y)
 
     def has_wall(self, x, y, direction):
         """Check for wall when facing some direction at some node in the maze.
@@ -416,20 +761,86 @@ class Maze:
         """
         if type(item0) == tuple:
             node0, node1 = self.node_at(*item0), self.node_at(*item1)
-            (x0,y0), (x1,y1) = item0, item1
         else: # Node
             node0, node1 = item0, item1
-            (x0,y0), (x1,y1) = item0.coordinates, item1.coordinates
+        (x0,y0), (x1,y1) = node0.coordinates, node1.coordinates
         dx, dy = x1-x0, y1-y0
         if abs(dx) + abs(dy) != 1:
             raise ValueError("nodes to connect must be neighbors")
-        get_dir = lambda dx,dy: (LEFT if dx<0 else RIGHT) if dx else (UP if dy<0 else DOWN)
+        self._connect_cells(node0._index, node1._index, invert)
+        return
+
+    def _connect_cells(self, index0, index1, invert=False):
+        """Enable/disable edge connection between two adjacent cell indices."""
+        offset = index1 - index0
+        if offset == self._width:
+            (dir0, dir1) = (DOWN, UP)
+        elif offset == -self._width:
+            (dir0, dir1) = (UP, DOWN)
+        elif offset == 1:
+            (dir0, dir1) = (RIGHT, LEFT)
+        else:
+            (dir0, dir1) = (LEFT, RIGHT)
+        edges = self._edges
+        if self._log is not None:
+            (old0, old1) = (edges[index0], edges[index1])
         if invert:
-            node0.remove_edge(get_dir(dx,dy))
-            node1.remove_edge(get_dir(-dx,-dy))
+            edges[index0] &= ~dir0
+            edges[index1] &= ~dir1
         else:
-            node0.put_edge(get_dir(dx,dy))
-            node1.put_edge(get_dir(-dx,-dy))
+            edges[index0] |= dir0
+            edges[index1] |= dir1
+        self._path_index = None
+        if self._dirty is not None:
+            self._dirty.add(index0)
+            self._dirty.add(index1)
+        if self._log is not None:
+            self._log._record(index0, old0 ^ edges[index0], 0)
+            self._log._record(index1, old1 ^ edges[index1], 0)
+        return
+
+    def _set_alg_id(self, index, alg_id):
+        """Set the algorithm id of a cell index, reporting the change like
+        `_connect_cells` does."""
+        if self._log is not None:
+            self._log._record(index, 0, self._alg_ids[index] ^ alg_id)
+        self._alg_ids[index] = alg_id
+        if self._dirty is not None:
+            self._dirty.add(index)
+        return
+
+    def _write_cells(self, index, edges=None, alg_ids=None):
+        """Overwrite a run of cells, reporting the changes like
+        `_connect_cells` does.
+
+        Args:
+            index (int): Index of the first cell.
+            edges (array.array('B')): New edges of the cells (default is None,
+                for unchanged edges).
+            alg_ids (array.array('H')): New algorithm ids of the cells
+                (default is None, for unchanged ids).
+        """
+        count = len(edges if edges is not None else alg_ids)
+        cells = range(index, index+count)
+        if self._log is not None:
+            old_edges = self._edges[index:index+count]
+            old_alg_ids = self._alg_ids[index:index+count]
+        if edges is not None:
+            self._edges[index:index+count] = edges
+            self._path_index = None
+        if alg_ids is not None:
+            self._alg_ids[index:index+count] = alg_ids
+        if self._dirty is not None:
+            self._dirty.update(cells)
+        if self._log is not None:
+            deltas = zip(
+                cells,
+                (a ^ b for (a,b) in zip(old_edges, self._edges[index:index+count])),
+                (a ^ b for (a,b) in zip(old_alg_ids, self._alg_ids[index:index+count])),
+            )
+            for (cell,edge_delta,alg_id_delta) in deltas:
+                if edge_delta or alg_id_delta:
+                    self._log._record(cell, edge_delta, alg_id_delta)
         return
 
     def set_entrance(self, x, y):
@@ -442,33 +853,73 @@ class Maze:
         self.exit = self.node_at(x,y)
         return
 
-    def _breadth_first_search(self, start_nodes, scanr=lambda _:None):
-        """Start a breadth first search at start nodes in the maze.
+    def _inner_edges(self):
+        """Copy of the edge array without edges leading out of the grid."""
+        (w, h) = (self._width, self._height)
+        edges = bytearray(self._edges)
+        edges[0::w] = edges[0::w].translate(bytes(e & ~LEFT for e in range(256)))
+        edges[w-1::w] = edges[w-1::w].translate(bytes(e & ~RIGHT for e in range(256)))
+        edges[:w] = edges[:w].translate(bytes(e & ~UP for e in range(256)))
+        edges[(h-1)*w:] = edges[(h-1)*w:].translate(bytes(e & ~DOWN for e in range(256)))
+        return edges
+
+    def _border_masks(self):
+        """Masks removing edges that lead out of the grid, by column and row."""
+        (columns, rows) = ([0xFF] * self._width, [0xFF] * self._height)
+        columns[0] &= ~LEFT
+        columns[-1] &= ~RIGHT
+        rows[0] &= ~UP
+        rows[-1] &= ~DOWN
+        return (columns, rows)
+
+    def _neighbor_offsets(self):
+        """Index offsets to the neighbors of a node, by its edges."""
+        directions = ((RIGHT,1), (UP,-self._width), (LEFT,-1), (DOWN,self._width))
+        return [
+            tuple(offset for (direction,offset) in directions if edges & direction)
+            for edges in range(256)
+        ]
+
+    def _bfs(self, start_indices, edges=None):
+        """Level-synchronous breadth first search writing into `_distances`.
 
-        BFS will ignore nodes that don't have `distance` set to infinite.
-        Else BFS will reset the start distance to 0 and then look for
-        unvisited nodes (distance infinity) until no more are found as usual.
+        Nodes whose distance is already set (i.e. not -1) count as visited,
+        start nodes are set to distance 0 and every newly reached node to its
+        distance from the nearest start node.
 
         Args:
-            start_nodes (Iterable(Node)): Iterable over the nodes to start at.
-            scanr (callable(Node)): Arbitrary function that gets called on every
-                node exactly once (default: lambda _: None)
+            start_indices (Iterable(int)): Indices of nodes to start at.
+            edges (bytearray): Edges to search along (default is
+                self._inner_edges()).
+
+        Returns:
+            list(list(int)): Indices of newly visited nodes for every distance.
         """
-        queue = collections.deque()
-        for start in start_nodes:
-            if start.distance < _INFINITY:
-                continue
-            queue.append(start)
-            start._distance = 0
-            scanr(start)
-        while queue:
-            current = queue.popleft()
-            neighbors = list(self.connected_to(current))
-            for neighbor in neighbors:
-                if neighbor.distance == _INFINITY:
-                    queue.append(neighbor)
-                    neighbor._distance = current.distance + 1
-                    scanr(neighbor)
+        if edges is None:
+            edges = self._inner_edges()
+        offsets = self._neighbor_offsets()
+        distances = self._distances
+        frontier = []
+        for index in start_indices:
+            if distances[index] < 0:
+                distances[index] = 0
+                frontier.append(index)
+        levels = []
+        distance = 0
+        while frontier:
+            levels.append(frontier)
+            distance += 1
+            candidates = [i+offset for i in frontier for offset in offsets[edges[i]]]
+            frontier = []
+            for index in candidates:
+                if distances[index] < 0:
+                    distances[index] = distance
+                    frontier.append(index)
+        return levels
+
+    def _reset_distances(self):
+        """Set all node distances to infinity (-1)."""
+        self._distances[:] = array.array('i', [-1]) * len(self._distances)
         return
 
     def _branch_distance(self, node):
@@ -484,13 +935,27 @@ class Maze:
             current = neighbors[0]
         return dist
 
-    def compute_solution(self, recompute_distances=True):
+    def compute_solution(self, recompute_distances=True, solver=None):
         """Recompute distances and solve maze by backtracking.
 
+        If a solver is given, only the nodes it explores are visited, and only
+        the distances of nodes on the solution path are set.
+
         Args:
             recompute_distances (bool): Whether to recompute distances using
-                `computer_distances` (default is True).
+                `computer_distances` (default is True), if no solver is given.
+            solver (str or callable(Maze,Node,Node) -> list(Node)): Name of a
+                solver in SOLVERS, or a function returning a shortest path
+                between two nodes or None (default is a full BFS).
         """
+        if solver is not None:
+            if isinstance(solver, str):
+                solver = SOLVERS[solver]
+            path = solver(self, self.entrance, self.exit) or []
+            self._solution_nodes = set(path)
+            for (distance,node) in enumerate(path):
+                node._distance = distance
+            return
         if recompute_distances:
             self.compute_distances()
         self._solution_nodes = set()
@@ -503,6 +968,113 @@ class Maze:
             self._solution_nodes.add(current)
         return
 
+    def _index_path(self, indices):
+        """Convert node indices into a list of nodes."""
+        w = self._width
+        return [Node(self, index % w, index // w) for index in indices]
+
+    @maze_solver
+    def bidirectional_bfs(self, start, goal):
+        """Find a shortest path by breadth first search from both ends.
+
+        The smaller of the two search frontiers is expanded by one level at a
+        time, until the searches meet.
+
+        Args:
+            start, goal (Node): Nodes to connect.
+
+        Returns:
+            list(Node): Nodes of the path from start to goal, or None if there
+                is no path.
+        """
+        (w, edges) = (self._width, self._edges)
+        (column_masks, row_masks) = self._border_masks()
+        offsets = self._neighbor_offsets()
+        # Parent of every visited node, per side
+        parents = ({start._index: None}, {goal._index: None})
+        depths = ({start._index: 0}, {goal._index: 0})
+        frontiers = ([start._index], [goal._index])
+        meeting = start._index if start == goal else None
+        while meeting is None and frontiers[0] and frontiers[1]:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            (own_parents, own_depths) = (parents[side], depths[side])
+            (other_parents, other_depths) = (parents[1-side], depths[1-side])
+            best_length = _INFINITY
+            frontier = []
+            for index in frontiers[side]:
+                depth = own_depths[index] + 1
+                cell_edges = edges[index] & column_masks[index%w] & row_masks[index//w]
+                for offset in offsets[cell_edges]:
+                    neighbor = index + offset
+                    if neighbor in own_parents:
+                        continue
+                    own_parents[neighbor] = index
+                    own_depths[neighbor] = depth
+                    frontier.append(neighbor)
+                    if neighbor in other_parents:
+                        # Complete the level, a later meeting might be shorter
+                        length = depth + other_depths[neighbor]
+                        if length < best_length:
+                            (meeting, best_length) = (neighbor, length)
+            frontiers = (frontier, frontiers[1]) if side == 0 else (frontiers[0], frontier)
+        if meeting is None:
+            return None
+        path = []
+        index = meeting
+        while index is not None:
+            path.append(index)
+            index = parents[0][index]
+        path.reverse()
+        index = parents[1][meeting]
+        while index is not None:
+            path.append(index)
+            index = parents[1][index]
+        return self._index_path(path)
+
+    @maze_solver
+    def astar(self, start, goal):
+        """Find a shortest path by A* search with the Manhattan heuristic.
+
+        Args:
+            start, goal (Node): Nodes to connect.
+
+        Returns:
+            list(Node): Nodes of the path from start to goal, or None if there
+                is no path.
+        """
+        (w, edges) = (self._width, self._edges)
+        (column_masks, row_masks) = self._border_masks()
+        offsets = self._neighbor_offsets()
+        (goal_index, (goal_x, goal_y)) = (goal._index, goal.coordinates)
+        heuristic = lambda index: abs(index%w - goal_x) + abs(index//w - goal_y)
+        parents = {start._index: None}
+        costs = {start._index: 0}
+        # Ties are broken towards larger cost, i.e. deeper into the search
+        queue = [(heuristic(start._index), 0, start._index)]
+        while queue:
+            (_, negative_cost, index) = heapq.heappop(queue)
+            if index == goal_index:
+                break
+            if -negative_cost > costs[index]:
+                continue # Outdated queue entry
+            cost = costs[index] + 1
+            cell_edges = edges[index] & column_masks[index%w] & row_masks[index//w]
+            for offset in offsets[cell_edges]:
+                neighbor = index + offset
+                if cost < costs.get(neighbor, _INFINITY):
+                    costs[neighbor] = cost
+                    parents[neighbor] = index
+                    heapq.heappush(queue, (cost + heuristic(neighbor), -cost, neighbor))
+        else:
+            return None
+        path = []
+        index = goal_index
+        while index is not None:
+            path.append(index)
+            index = parents[index]
+        path.reverse()
+        return self._index_path(path)
+
     # FIXME: Argument should probably take start_nodes, or entire functionality merged with compute_distances_from.
     def compute_distances(self, start_coord=None):
         """Reset and compute all node distances within maze.
@@ -515,9 +1087,8 @@ class Maze:
             start = self.entrance
         else:
             start = self.node_at(*start_coord)
-        for node in self.nodes():
-            node._distance = _INFINITY
-        self._breadth_first_search([start])
+        self._reset_distances()
+        self._bfs([start._index])
         return
 
     def compute_distances_from(self, start_nodes=None):
@@ -529,56 +1100,246 @@ class Maze:
         """
         if start_nodes is None:
             start_nodes = [self.entrance]
-        for node in self.nodes():
-            node._distance = _INFINITY
-        self._breadth_first_search(start_nodes)
+        self._reset_distances()
+        self._bfs(node._index for node in start_nodes)
         return
 
     def compute_branchdistances(self):
         """Reset and compute all distances from nearest dead end within branch.
 
         This will compute the distance that a node is within a 'branch',
-        i.e. between an intersection and a dead end.
-        """
-        for node in self.nodes():
-            node._distance = _INFINITY
-        for node in self.nodes():
-            if node.distance == _INFINITY:
-                previous = None
-                previous_distance = -1
-                current = node
-                while len(neighbors := [
-                        nbr for nbr in self.connected_to(current)
-                        if nbr!=previous]) == 1:
-                    current._distance = previous_distance + 1
-                    previous_distance = current._distance
-                    previous = current
-                    current = neighbors[0]
+        i.e. between an intersection and a dead end (see `_peel_branches`).
+        """
+        (_, branch_distances, _) = self._peel_branches()
+        self._distances[:] = branch_distances
         return
 
+    def _peel_branches(self):
+        """Peel the branches off the maze graph, one layer of nodes at a time.
+
+        All dead ends start a branch at once, and every layer advances each
+        branch by one node along its corridor, until it hits an intersection,
+        another dead end or the other half of the same corridor.
+
+        Returns:
+            tuple(bytearray,array,array): Number of edges of every node (1 for
+                dead ends, >=3 for intersections), distance of every node from
+                the dead end of its branch (-1 outside branches), and length of
+                the branch starting at every dead end (-1 for other nodes).
+        """
+        edges = self._inner_edges()
+        offsets = self._neighbor_offsets()
+        degrees = edges.translate(_EDGE_COUNTS)
+        distances = array.array('i', [-1]) * len(edges)
+        lengths = array.array('i', [-1]) * len(edges)
+        # Branches advance in lockstep as (dead end, previous node, node)
+        branches = []
+        for (index,degree) in enumerate(degrees):
+            if degree == 1:
+                distances[index] = 0
+                branches.append((index, index, index+offsets[edges[index]][0]))
+        distance = 0
+        while branches:
+            distance += 1
+            advancing = []
+            for (origin, previous, current) in branches:
+                if degrees[current] != 2:
+                    lengths[origin] = distance
+                elif distances[current] >= 0:
+                    # Met branch from other end, so all of this is one corridor
+                    lengths[origin] = distance + distances[current]
+                else:
+                    distances[current] = distance
+                    (offset0, offset1) = offsets[edges[current]]
+                    following = current+offset1 if current+offset0 == previous else current+offset0
+                    advancing.append((origin, current, following))
+            branches = advancing
+        return (degrees, distances, lengths)
+
     def compute_longest_path(self):
-        """Compute and set as entrance&exit a longest path within the maze."""
-        for node in self.nodes():
-            node._distance = _INFINITY
-        global counter
-        counter = 0
-        def increment_counter(n):
-            global counter
-            counter += 1
-        for node in self.nodes():
-            if counter == self.width*self.height:
+        """Compute and set as entrance&exit a longest path within the maze.
+
+        See `compute_diameters`, the longest path of all components is used
+        and distances are left as computed from the new entrance.
+        """
+        diameters = self.compute_diameters()
+        (self.entrance, self.exit, length) = max(diameters, key=lambda d:d[2])
+        if len(diameters) > 1:
+            # Leave other components unreachable
+            self._reset_distances()
+            self._bfs([self.entrance._index])
+        return length
+
+    def compute_diameters(self, exact=False):
+        """Compute a longest shortest path within every connected component.
+
+        Components which are trees (as in perfect mazes) are solved exactly by
+        two BFS sweeps: the node farthest from any node is an endpoint of a
+        longest path. Other components are swept repeatedly from the last
+        farthest node until the path stops growing, which only yields a lower
+        bound unless `exact` is set.
+        Distances are left as computed from the first endpoint in every
+        component.
+
+        Args:
+            exact (bool): Whether to search components with cycles from every
+                node, in O(nodes*edges) time (default is False).
+
+        Returns:
+            list(tuple(Node,Node,int)): Endpoints and length of a longest path
+                for every component, ordered by their first node.
+        """
+        w = self._width
+        edges = self._inner_edges()
+        degrees = edges.translate(_EDGE_COUNTS)
+        distances = self._distances
+        self._reset_distances()
+        def sweep(start, component):
+            if len(component) == len(distances):
+                self._reset_distances()
+            else:
+                for index in component:
+                    distances[index] = -1
+            levels = self._bfs([start], edges)
+            return (min(levels[-1]), len(levels)-1)
+        diameters = []
+        first = 0
+        while True:
+            try:
+                first = distances.index(-1, first)
+            except ValueError:
                 break
-            self._breadth_first_search([node], scanr=increment_counter)
-        finite_nodes = [n for n in self.nodes() if n.distance < _INFINITY]
-        farthest = max(finite_nodes, key=lambda n:n.distance)
-        self.entrance = farthest
-        for node in self.nodes():
-            node._distance = _INFINITY
-        self._breadth_first_search([self.entrance])
-        finite_nodes = [n for n in self.nodes() if n.distance < _INFINITY]
-        farthest = max(finite_nodes, key=lambda n:n.distance)
-        self.exit = farthest
-        return self.exit.distance
+            levels = self._bfs([first], edges)
+            component = list(itertools.chain.from_iterable(levels))
+            start = min(levels[-1])
+            (end, length) = sweep(start, component)
+            is_tree = sum(degrees[index] for index in component) == 2*(len(component)-1)
+            if not is_tree and exact:
+                for index in component:
+                    (far, eccentricity) = sweep(index, component)
+                    if eccentricity > length:
+                        (start, end, length) = (index, far, eccentricity)
+                sweep(start, component)
+            elif not is_tree:
+                while True:
+                    (far, eccentricity) = sweep(end, component)
+                    (start, end) = (end, far)
+                    if eccentricity == length:
+                        break
+                    length = eccentricity
+            diameters.append((
+                Node(self, start % w, start // w),
+                Node(self, end % w, end // w),
+                length,
+            ))
+        return diameters
+
+    def _build_path_index(self):
+        """Root the spanning forest of the maze for `distance_between` etc.
+
+        Every node gets its parent and depth in a BFS tree of its component,
+        as well as a 'jump pointer' to an ancestor such that jumps have skew
+        binary lengths (Myers, 1983). Any ancestor, and therefore the lowest
+        common ancestor of two nodes, can then be found in O(log depth) steps
+        with O(nodes) memory.
+
+        Returns:
+            tuple(array,array,array): Parent (-1 for roots), depth and jump
+                pointer of every node.
+        """
+        edges = self._inner_edges()
+        offsets = self._neighbor_offsets()
+        cellcount = len(edges)
+        parents = array.array('l', [-2]) * cellcount # -2 = unvisited
+        depths = array.array('l', [0]) * cellcount
+        jumps = array.array('l', range(cellcount))
+        root = 0
+        while True:
+            try:
+                root = parents.index(-2, root)
+            except ValueError:
+                break
+            parents[root] = -1
+            frontier = [root]
+            while frontier:
+                following = []
+                for index in frontier:
+                    (parent, depth, jump) = (parents[index], depths[index], jumps[index])
+                    # Children jump twice as far as `index` if it jumps as far
+                    # as its target, else only to `index`
+                    if depth - depths[jump] == depths[jump] - depths[jumps[jump]]:
+                        child_jump = jumps[jump]
+                    else:
+                        child_jump = index
+                    for offset in offsets[edges[index]]:
+                        neighbor = index + offset
+                        if neighbor == parent:
+                            continue
+                        if parents[neighbor] != -2:
+                            raise ValueError("maze has cycles, paths are not unique")
+                        parents[neighbor] = index
+                        depths[neighbor] = depth + 1
+                        jumps[neighbor] = child_jump
+                        following.append(neighbor)
+                frontier = following
+        return (parents, depths, jumps)
+
+    def _lowest_common_ancestor(self, index0, index1):
+        """Lowest common ancestor of two nodes in the path index, or -1."""
+        if self._path_index is None:
+            self._path_index = self._build_path_index()
+        (parents, depths, jumps) = self._path_index
+        if depths[index0] < depths[index1]:
+            (index0, index1) = (index1, index0)
+        depth = depths[index1]
+        while depths[index0] > depth:
+            jump = jumps[index0]
+            index0 = jump if depths[jump] >= depth else parents[index0]
+        while index0 != index1:
+            if parents[index0] == -1: # Different components
+                return -1
+            if jumps[index0] != jumps[index1]:
+                (index0, index1) = (jumps[index0], jumps[index1])
+            else:
+                (index0, index1) = (parents[index0], parents[index1])
+        return index0
+
+    def distance_between(self, node0, node1):
+        """Length of the path between two nodes of a maze without cycles.
+
+        The first query builds an index of the maze (see `_build_path_index`),
+        after which queries take O(log n) time, until the maze is modified.
+
+        Args:
+            node0, node1 (Node): Nodes to measure distance between.
+
+        Returns:
+            int: Number of edges on the path, or infinity if there is none.
+        """
+        ancestor = self._lowest_common_ancestor(node0._index, node1._index)
+        if ancestor == -1:
+            return _INFINITY
+        depths = self._path_index[1]
+        return depths[node0._index] + depths[node1._index] - 2*depths[ancestor]
+
+    def path_between(self, node0, node1):
+        """Path between two nodes of a maze without cycles, see `distance_between`.
+
+        Args:
+            node0, node1 (Node): Start and end node of path.
+
+        Returns:
+            list(Node): Nodes of the path, or None if there is none.
+        """
+        ancestor = self._lowest_common_ancestor(node0._index, node1._index)
+        if ancestor == -1:
+            return None
+        parents = self._path_index[0]
+        (half0, half1) = ([node0._index], [node1._index])
+        for half in (half0, half1):
+            while half[-1] != ancestor:
+                half.append(parents[half[-1]])
+        return self._index_path(half0 + half1[-2::-1])
 
     def generate_algorithm_shares(self):
         """Count number of nodes written by any algorithm.
@@ -588,10 +1349,8 @@ class Maze:
                 they wrote/visited within the maze.
         """
         null_cat = 'unidentified'
-        algorithm_amounts = [0] * len(ALGORITHMS)
-        for node in self.nodes():
-            if 0 <= node._alg_id < len(algorithm_amounts):
-                algorithm_amounts[node._alg_id] += 1
+        alg_id_counts = collections.Counter(self._alg_ids)
+        algorithm_amounts = [alg_id_counts[i] for i in range(len(ALGORITHMS))]
         algorithm_shares = dict(zip(ALGORITHMS,algorithm_amounts))
         return algorithm_shares
 
@@ -604,31 +1363,49 @@ class Maze:
                 The second is a list of all the distances found within branch
                 nodes from their nearest dead end.
                 The third list is a list of all maximum distances of paths that
-                branch off the current solution path.
+                branch off the current solution path (in mazes with cycles,
+                nodes count towards the nearest offshoot).
         """
-        is_dead_end = lambda node: (node._edges in [1,2,4,8])
         # Prepare accumulators for tiles and distance stats
         self.compute_solution()
         tiles_counts = [0 for _ in range(0b10000)]
-        branch_distances = []
-        for node in self.nodes():
-            tiles_counts[node._edges] += 1
-            if is_dead_end(node):
-                branch_distances.append(self._branch_distance(node))
-            # Preparation for next part
-            if node not in self._solution_nodes:
-                node._distance = _INFINITY
+        for (edges,count) in collections.Counter(self._edges).items():
+            tiles_counts[edges] = count
+        (_, _, branch_lengths) = self._peel_branches()
+        branch_distances = [length for length in branch_lengths if length >= 0]
         if tiles_counts[0b0001]+tiles_counts[0b0010]+tiles_counts[0b0100]+tiles_counts[0b1000] == 0:
             raise ValueError("maze has no dead ends, aborting analysis")
-        offshoots_maxlengths = []
-        for node in self._solution_nodes:
-            for offshoot in self.connected_to(node):
-                if offshoot not in self._solution_nodes:
-                    lengths = []
-                    length_adder = lambda n: lengths.append(n.distance) if is_dead_end(n) else None
-                    self._breadth_first_search([offshoot], scanr=length_adder)
-                    maxlength = max(lengths, default=0)
-                    offshoots_maxlengths.append(maxlength)
+        # Search all offshoots of the solution path at once, keeping solution
+        # distances so the search doesn't cross the path
+        (edges, distances) = (self._inner_edges(), self._distances)
+        solution = [(node._index, distances[node._index]) for node in self._solution_nodes]
+        self._reset_distances()
+        owners = array.array('i', [-1]) * len(distances)
+        for (index,distance) in solution:
+            (distances[index], owners[index]) = (distance, -2)
+        roots = [
+            offshoot._index
+            for node in self._solution_nodes
+            for offshoot in self.connected_to(node)
+            if offshoot not in self._solution_nodes
+        ]
+        levels = self._bfs(roots, edges)
+        for (k,root) in reversed(list(enumerate(roots))):
+            owners[root] = k
+        # Label every node by the offshoot it belongs to (its BFS ancestor)
+        offsets = self._neighbor_offsets()
+        for (distance,level) in enumerate(levels[:-1], start=1):
+            for index in level:
+                owner = owners[index]
+                for offset in offsets[edges[index]]:
+                    if owners[index+offset] == -1 and distances[index+offset] == distance:
+                        owners[index+offset] = owner
+        # Maximum depth of a dead end in every offshoot (its subtree height)
+        offshoots_maxlengths = [0] * len(roots)
+        for index in itertools.chain.from_iterable(levels):
+            if _EDGE_COUNTS[self._edges[index]] == 1:
+                k = owners[index]
+                offshoots_maxlengths[k] = max(offshoots_maxlengths[k], distances[index])
         return (tiles_counts, branch_distances, offshoots_maxlengths)
 
     def generate_raster(self, wall_air_ratio=(1,1), decolumnated=False, show_solution=False, show_distances=False, show_algorithms=False):
@@ -659,93 +1436,159 @@ class Maze:
             list(list(bool)): 2D raster 'image' of the maze.
         """
         (wallM, airM) = wall_air_ratio
-        if not decolumnated:
-            column = lambda node, dirc, wall, air: wall
-        else:
-            column = (lambda node, dirc, wall, air:
-                wall if dirc!=3
-                or node.has_wall(RIGHT) or node.has_wall(DOWN)
-                or x==self.width-1 or y==self.height-1
-                or (xp:=1+node.coordinates[0])and()or(yp:=1+node.coordinates[1])and()
-                or self.node_at(xp,yp).has_wall(UP) or self.node_at(xp,yp).has_wall(LEFT)
-                else air
-            )
-        # `pxl` takes three values:
-        # - `node`: current node we're situated at, None if drawing wall
-        # - `dirc`: direction which we're painting away from, None if centered on node
-        # - `nbr` : neighboring node into direction, for certain checks, None if fringe
+        (w, h) = (self.width, self.height)
+        (edges, distances, alg_ids) = (self._edges, self._distances, self._alg_ids)
+        no_cells = [0] * w
         if show_solution:
             if self._solution_nodes is None:
                 raise RuntimeError("cannot show solution path before computing it")
-            is_sol = lambda n: n in self._solution_nodes
-            pxl = (lambda node, dirc, nbr:
-                column(nbr,dirc,(-1),0) if node is None # wall
-                else (node.distance+1 if is_sol(node) else 0) if dirc is None # center air
-                else (-1) if node.has_wall(dirc) # directional wall
-                else (node.distance+1 if is_sol(node) else 0) if nbr is not None and is_sol(nbr) # directional colored air
-                else 0 # directional air
-            )
-        elif show_distances:
-            dist_col = lambda node: node.distance if node.distance!=_INFINITY else -2 # None check only because py not lazily evaluated <curse words here>
-            pxl = (lambda node, dirc, nbr:
-                column(nbr,dirc,(-1),dist_col(nbr) if nbr is not None else (-1)) if node is None # wall
-                else dist_col(node) if dirc is None # center air
-                else (-1) if node.has_wall(dirc) # directional wall
-                else dist_col(node) # directional colored air
-            )
-        elif show_algorithms:
-            pxl = (lambda node, dirc, nbr:
-                column(nbr,dirc,(-1),(nbr._alg_id<<1) if nbr is not None else 0) if node is None # wall
-                else (node._alg_id<<1) if dirc is None # center air
-                else (-1) if node.has_wall(dirc) # directional wall
-                else 1+(node._alg_id<<1)+(nbr._alg_id<<(1+_ALGORITHMS_EXP2_MAX)) if nbr is not None # directional colored air
-                else 0 # directional air
-            )
-        else:
-            pxl = (lambda node, dirc, nbr:
-                column(nbr,dirc,( 1),0) if node is None # wall
-                else 0 if dirc is None # center air
-                else ( 1) if node.has_wall(dirc) # directional wall
-                else 0 # directional colored air
-            )
-        rows = self._lattice
+            on_solution = bytearray(w*h)
+            for node in self._solution_nodes:
+                on_solution[node._index] = 1
+        # Each lattice row is described by per-cell values for
+        # - `center`: air within node
+        # - `right` : wall/air to the right of node
+        # - `down`  : wall/air below node
+        # - `corner`: (column) wall to the bottom right of node
+        # as well as one value for the left border and one per cell for the top
+        # border (only in the first row). Per-mode values agree with the table
+        # in the docstring.
+        wall = 1 if not (show_solution or show_distances or show_algorithms) else -1
+        def row_values(y):
+            row = edges[y*w:(y+1)*w]
+            row_below = edges[(y+1)*w:(y+2)*w] or no_cells
+            if show_solution:
+                sol = on_solution[y*w:(y+1)*w]
+                sol_right = on_solution[y*w+1:(y+1)*w] + b'\0'
+                sol_below = on_solution[(y+1)*w:(y+2)*w] or no_cells
+                center = [d+1 if s else 0 for (d,s) in zip(distances[y*w:(y+1)*w],sol)]
+                right = [
+                    -1 if not e & RIGHT else c if n else 0
+                    for (e,c,n) in zip(row,center,sol_right)
+                ]
+                down = [
+                    -1 if not e & DOWN else c if n else 0
+                    for (e,c,n) in zip(row,center,sol_below)
+                ]
+                corner_air = no_cells
+            elif show_distances:
+                center = [d if d >= 0 else -2 for d in distances[y*w:(y+1)*w]]
+                right = [c if e & RIGHT else -1 for (e,c) in zip(row,center)]
+                down = [c if e & DOWN else -1 for (e,c) in zip(row,center)]
+                corner_air = center
+            elif show_algorithms:
+                algs = alg_ids[y*w:(y+1)*w]
+                algs_right = alg_ids[y*w+1:(y+1)*w].tolist() + [None]
+                algs_below = alg_ids[(y+1)*w:(y+2)*w].tolist() or [None]*w
+                center = [a<<1 for a in algs]
+                right = [
+                    -1 if not e & RIGHT
+                    else 0 if n is None
+                    else 1+(a<<1)+(n<<(1+_ALGORITHMS_EXP2_MAX))
+                    for (e,a,n) in zip(row,algs,algs_right)
+                ]
+                down = [
+                    -1 if not e & DOWN
+                    else 0 if n is None
+                    else 1+(a<<1)+(n<<(1+_ALGORITHMS_EXP2_MAX))
+                    for (e,a,n) in zip(row,algs,algs_below)
+                ]
+                corner_air = center
+            else:
+                center = no_cells
+                right = [0 if e & RIGHT else 1 for e in row]
+                down = [0 if e & DOWN else 1 for e in row]
+                corner_air = no_cells
+            if decolumnated and y < h-1:
+                # Corner is air iff the four surrounding nodes form a cycle
+                corner = [
+                    air if e & (RIGHT|DOWN) == (RIGHT|DOWN) and diag & (UP|LEFT) == (UP|LEFT)
+                    else wall
+                    for (e,diag,air) in zip(row,row_below[1:],corner_air)
+                ] + [wall]
+            else:
+                corner = [wall] * w
+            if show_distances:
+                left = center[0] if row[0] & LEFT else wall
+                top = [c if e & UP else wall for (e,c) in zip(row,center)]
+            else:
+                left = (0 if row[0] & LEFT else wall)
+                top = [0 if e & UP else wall for e in row]
+            return (left, top, center, right, down, corner)
+        period = airM + wallM
+        def expand(border, air_values, wall_values):
+            """Repeat per-cell values into one raster row by slice assignment."""
+            row = [border] * (wallM + w*period)
+            for k in range(airM):
+                row[wallM+k::period] = air_values
+            for k in range(wallM):
+                row[wallM+airM+k::period] = wall_values
+            return row
         raster = []
-        # Top-left corner
-        row1 = [pxl(None, 0, None)] * wallM
-        # Top wall
-        for x,node in enumerate(rows[0]):
-            row1 += [pxl(node, UP, None)] * airM
-            row1 += [pxl(None, 1, None)] * wallM
-        raster += [row1] * wallM
-        # Middle and bottom rows of string
-        for y,row in enumerate(rows):
-            # Left wall
-            row1 = [pxl(row[0], LEFT, None)] * wallM
-            row2 = [pxl(None, 2, None)] * wallM
-            # Middle and bottom walls (2 blocks/node)
-            for x,node in enumerate(row):
-                row1 += [pxl(node, None, None)] * airM
-                row1 += [pxl(node, RIGHT, None if x==self.width-1 else self.node_at(x+1,y))] * wallM
-                row2 += [pxl(node, DOWN, None if y==self.height-1 else self.node_at(x,y+1))] * airM
-                row2 += [pxl(None, 3, node)] * wallM
-            raster += [row1] * airM
-            raster += [row2] * wallM
+        for y in range(h):
+            (left, top, center, right, down, corner) = row_values(y)
+            if y == 0:
+                # Top-left corner and top wall
+                raster += [expand(wall, top, [wall]*w)] * wallM
+            # Left wall, nodes and their right walls
+            raster += [expand(left, center, right)] * airM
+            # Left wall, bottom walls and corners
+            raster += [expand(wall, down, corner)] * wallM
         return raster
 
     @staticmethod
-    def _raster_to_image(raster, value_to_color):
+    def _raster_values(raster):
+        """Collect the set of distinct values appearing in a raster."""
+        unique_rows = {id(row):row for row in raster}.values()
+        return set(itertools.chain.from_iterable(unique_rows))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _gradient_table(gradient_colors, peak):
+        """Precompute the gradient color of every integer 0..peak.
+
+        Args:
+            gradient_colors (tuple(tuple(int,int,int))): RGB integer color
+                tuples of the gradient (must be hashable for caching).
+            peak (int): Positive integer value mapped to the gradient's end.
+
+        Returns:
+            tuple(tuple(int,int,int)): Color table indexed by value.
+        """
+        return tuple(
+            ct.interpolate(gradient_colors, param=value/peak)
+            for value in range(peak+1)
+        )
+
+    @staticmethod
+    def _raster_to_image(raster, value_to_color, values=None):
         """Convert a raster into a PIL Image object using a conversion function.
 
+        The conversion function is only called once per distinct raster value
+        to build a color lookup table, which is then gathered row by row into
+        a single RGB byte buffer (rows repeated in the raster are only
+        converted once).
+
         Args:
             raster (list(list(int))): 2D 'map'.
             value_to_color (callable(int) -> tuple(int,int,int)): a function to
                 convert raster values to RGB integer tuples.
+            values (set(int)): Distinct values of the raster, if already
+                known (default is Maze._raster_values(raster)).
 
         Returns:
             PIL.Image: Image object.
         """
-        image = Image.new('RGB', (len(raster[0]),len(raster)))
-        image.putdata([value_to_color(value) for row in raster for value in row])
+        unique_rows = {id(row):row for row in raster}
+        if values is None:
+            values = Maze._raster_values(raster)
+        color_table = {value:bytes(value_to_color(value)) for value in values}
+        row_data = {
+            row_id:b''.join(map(color_table.__getitem__, row))
+            for (row_id,row) in unique_rows.items()
+        }
+        data = b''.join(row_data[id(row)] for row in raster)
+        image = Image.frombytes('RGB', (len(raster[0]),len(raster)), data)
         return image
 
     def generate_image(self, wall_air_colors=(ct.BLACK,ct.WHITE), raster=None):
@@ -771,6 +1614,213 @@ class Maze:
         image.filename = f"{self.name()}_{self._stamp()}.png"
         return image
 
+    def to_png(self, path, wall_air_ratio=(1,1), wall_air_colors=(ct.BLACK,ct.WHITE), decolumnated=False):
+        """Render the maze straight into a PNG file, see `rows_to_png`.
+
+        Produces the same picture as `generate_image` would for the raster
+        `generate_raster(wall_air_ratio, decolumnated)`, but never holds more
+        than one lattice row of pixels in memory.
+
+        Args:
+            path (str): Location of file to write.
+            wall_air_ratio (tuple(int,int)): Thickness of wall and air parts.
+            wall_air_colors (tuple(tuple(int,int,int),tuple(int,int,int))):
+                RGB integer color tuples for the wall- and air pixel colors,
+                respectively (default is (ct.BLACK,ct.WHITE)).
+            decolumnated (bool): Whether free-standing 'column' pieces should
+                be removed in free 4x4 sections of the maze (default is False).
+        """
+        (w, h) = (self.width, self.height)
+        Maze.rows_to_png(
+            path, w, h,
+            (self._edges[y*w:(y+1)*w].tobytes() for y in range(h)),
+            wall_air_ratio=wall_air_ratio,
+            wall_air_colors=wall_air_colors,
+            decolumnated=decolumnated,
+            packed=False,
+        )
+        return
+
+    @staticmethod
+    def rows_to_png(path, width, height, rows, wall_air_ratio=(1,1), wall_air_colors=(ct.BLACK,ct.WHITE), decolumnated=False, packed=True):
+        """Render rows of edges into a PNG file without a `Maze` object.
+
+        Lattice rows are turned into their `wallM + airM` pixel rows one at a
+        time (using one row lookahead for `decolumnated`) and compressed
+        directly into the file by a `PNGWriter`.
+
+        Args:
+            path (str): Location of file to write.
+            width, height (int): Positive integer dimensions of maze.
+            rows (iterable(bytes)): Rows of edges, e.g. from `eller_rows`.
+            wall_air_ratio (tuple(int,int)): Thickness of wall and air parts.
+            wall_air_colors (tuple(tuple(int,int,int),tuple(int,int,int))):
+                RGB integer color tuples for the wall- and air pixel colors,
+                respectively (default is (ct.BLACK,ct.WHITE)).
+            decolumnated (bool): Whether free-standing 'column' pieces should
+                be removed in free 4x4 sections of the maze (default is False).
+            packed (bool): Whether rows are packed two nodes per byte like
+                `to_bytes`, else one node per byte (default is True).
+        """
+        (wallM, airM) = wall_air_ratio
+        period = wallM + airM
+        pixel_rows = Maze._pixel_rows(width, height, rows, wall_air_ratio, decolumnated, packed)
+        with PNGWriter(path, wallM + width*period, wallM + height*period, wall_air_colors) as png:
+            for (pixels,repeat) in pixel_rows:
+                png.write_row(pixels, repeat)
+        return
+
+    @staticmethod
+    def _pixel_rows(width, height, rows, wall_air_ratio, decolumnated, packed, wall_air_indices=(0,1)):
+        """Generate the pixel rows of rows of edges, as used by `rows_to_png`.
+
+        Args:
+            width, height (int): Positive integer dimensions of maze.
+            rows (iterable(bytes)): Rows of edges.
+            wall_air_ratio (tuple(int,int)): Thickness of wall and air parts.
+            decolumnated (bool): Whether free-standing 'column' pieces should
+                be removed in free 4x4 sections of the maze.
+            packed (bool): Whether rows are packed two nodes per byte.
+            wall_air_indices (tuple(int,int)): Pixel values of wall and air
+                (default is (0,1)).
+
+        Yields:
+            tuple(bytearray,int): Pixel row and how many times it repeats.
+        """
+        (wallM, airM) = wall_air_ratio
+        period = wallM + airM
+        (WALL, AIR) = wall_air_indices
+        # Per-node lookup tables from edges to pixel values
+        air_if = lambda mask: bytes(AIR if e & mask == mask else WALL for e in range(256))
+        (air_if_up, air_if_right, air_if_down) = (air_if(UP), air_if(RIGHT), air_if(DOWN))
+        flag_if = lambda mask: bytes(e & mask == mask for e in range(256))
+        (flag_if_down_right, flag_if_up_left) = (flag_if(DOWN|RIGHT), flag_if(UP|LEFT))
+        flag_to_value = bytes([WALL, AIR]) + bytes(254)
+        walls = bytes([WALL]) * width
+        airs = bytes([AIR]) * width
+        def expand(border, air_values, wall_values):
+            """Repeat per-node values into one pixel row by slice assignment."""
+            pixels = bytearray([border]) * (wallM + width*period)
+            for k in range(airM):
+                pixels[wallM+k::period] = air_values
+            for k in range(wallM):
+                pixels[wallM+airM+k::period] = wall_values
+            return pixels
+        def unpacked(rows):
+            for (y,row) in enumerate(rows):
+                row = bytes(Maze._unpack_nibbles(row, row_length=width) if packed else row)
+                if len(row) != width:
+                    raise ValueError(f"row {y} does not hold {width} nodes")
+                yield row
+        rows = unpacked(rows)
+        row = next(rows, None)
+        for y in range(height):
+            if row is None:
+                raise ValueError(f"got {y} rows instead of {height}")
+            row_below = next(rows, None) if y < height-1 else None
+            if y == 0:
+                # Top-left corner and top wall
+                yield (expand(WALL, row.translate(air_if_up), walls), wallM)
+            # Left wall, nodes and their right walls
+            left = AIR if row[0] & LEFT else WALL
+            yield (expand(left, airs, row.translate(air_if_right)), airM)
+            # Left wall, bottom walls and corners
+            if decolumnated and row_below is not None:
+                # Corner is air iff the four surrounding nodes form a cycle
+                corners = (
+                    int.from_bytes(row.translate(flag_if_down_right), 'little')
+                    & int.from_bytes(row_below[1:].translate(flag_if_up_left), 'little')
+                ).to_bytes(width, 'little').translate(flag_to_value)
+            else:
+                corners = walls
+            yield (expand(WALL, row.translate(air_if_down), corners), wallM)
+            row = row_below
+        return
+
+    def to_tiles(self, directory, tile_size=256, wall_air_ratio=(1,1), wall_air_colors=(ct.BLACK,ct.WHITE), decolumnated=False, max_workers=None):
+        """Render the maze into a pyramid of PNG map tiles.
+
+        Tiles are written to `directory/z/x/y.png`, where the highest zoom
+        level shows the image of `to_png` at full resolution and every lower
+        level halves it, down to a single tile at level 0. Tiles at the right
+        and bottom edges of the image are cut off rather than padded.
+
+        Full resolution tiles are rendered only from the lattice area they
+        cover (plus a one node margin), lower levels by downsampling their four
+        children. Subtrees of the pyramid are rendered by worker processes,
+        which receive the maze via `to_bytes`.
+        Identical tiles (e.g. in open rooms) are only encoded once: they are
+        stored by content hash in `directory/_hashed` and hard linked (or
+        copied, if links are unsupported) into place.
+
+        Args:
+            directory (str): Location of directory to write tiles into.
+            tile_size (int): Side length of tiles in pixels (default is 256).
+            wall_air_ratio (tuple(int,int)): Thickness of wall and air parts.
+            wall_air_colors (tuple(tuple(int,int,int),tuple(int,int,int))):
+                RGB integer color tuples for the wall- and air pixel colors,
+                respectively (default is (ct.BLACK,ct.WHITE)).
+            decolumnated (bool): Whether free-standing 'column' pieces should
+                be removed in free 4x4 sections of the maze (default is False).
+            max_workers (int): Maximum number of worker processes (default is
+                os.cpu_count()).
+
+        Returns:
+            int: Highest zoom level.
+        """
+        (wallM, airM) = wall_air_ratio
+        period = wallM + airM
+        # Pixel dimensions of each zoom level, from highest to lowest
+        level_sizes = [(wallM + self.width*period, wallM + self.height*period)]
+        while max(level_sizes[-1]) > tile_size:
+            (w, h) = level_sizes[-1]
+            level_sizes.append(((w+1) // 2, (h+1) // 2))
+        level_sizes.reverse()
+        (wall_color, air_color) = wall_air_colors
+        spec = {
+            'directory': directory,
+            'tile_size': tile_size,
+            'wall_air_ratio': wall_air_ratio,
+            'decolumnated': decolumnated,
+            'level_sizes': level_sizes,
+            # Downsampled pixels are averaged, so blend wall into air color
+            'palette': [ct.mix(wall_color, air_color, i/255) for i in range(256)],
+        }
+        max_zoom = len(level_sizes) - 1
+        tile_counts = [
+            (-(-w // tile_size), -(-h // tile_size)) for (w,h) in level_sizes
+        ]
+        os.makedirs(os.path.join(directory, '_hashed'), exist_ok=True)
+        for (z,(columns,_)) in enumerate(tile_counts):
+            for x in range(columns):
+                os.makedirs(os.path.join(directory, str(z), str(x)), exist_ok=True)
+        # Hand out subtrees rooted at the first level with enough tiles
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        block_zoom = next(
+            (z for (z,(columns,rows)) in enumerate(tile_counts) if columns*rows >= 4*max_workers),
+            max_zoom,
+        )
+        (columns, rows) = tile_counts[block_zoom]
+        blocks = [(x,y) for y in range(rows) for x in range(columns)]
+        if len(blocks) == 1 or max_workers == 1:
+            _render_tile(self, spec, 0, 0, 0)
+            return max_zoom
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers,
+            initializer=_init_tile_worker,
+            initargs=(self.to_bytes(with_algorithms=False),),
+        ) as executor:
+            results = executor.map(
+                _render_tile_block,
+                itertools.repeat(spec),
+                itertools.repeat(block_zoom),
+                *zip(*blocks),
+            )
+            block_tiles = dict(zip(blocks, results))
+        _render_tile(self, spec, 0, 0, 0, (block_zoom, block_tiles))
+        return max_zoom
+
     def generate_solutionimage(self, wall_air_marker_colors=None, raster=None):
         """Generate an Image object showing the maze and its solution.
 
@@ -790,13 +1840,18 @@ class Maze:
             if self._solution_nodes is None:
                 self.compute_solution()
             raster = self.generate_raster(show_solution=True)
+        values = Maze._raster_values(raster)
         # color conversion
         if wall_air_marker_colors is None:
-            peak = self.exit.distance or 1
+            peak = self.exit.distance
+            if peak == _INFINITY: # Outdated solution, fall back to raster
+                peak = max(values) - 1
+            peak = max(peak, 1)
             wall_color = ct.BLACK
             air_color = ct.WHITE
             rainbow = ct.rainbow_palette(32, ct.VIOLET, keepend=True)
-            marker_color = lambda value: ct.interpolate(rainbow, (value-1)/peak)
+            marker_colors = Maze._gradient_table(tuple(rainbow), peak)
+            marker_color = lambda value: marker_colors[value-1]
             #marker_color = lambda value: ct.rainbow(-value/peak, ct.VIOLET, ct.OKLCH)
             #marker_color = lambda value: ct.change_space((360*value/peak, 1, 1),ct.HSV,ct.RGB)
             #marker_color = ct.BLUE
@@ -806,7 +1861,7 @@ class Maze:
             marker_color = lambda value: wall_air_marker_colors[2]
         value_to_color = lambda value: wall_color if value==(-1) else air_color if value==0 else marker_color(value)
         # Convert to image
-        image = Maze._raster_to_image(raster, value_to_color)
+        image = Maze._raster_to_image(raster, value_to_color, values)
         image.filename = f"{self.name()}_solution_{self._stamp()}.png"
         return image
 
@@ -830,11 +1885,12 @@ class Maze:
         unreachable_color = ct.DARK_GRAY
         if gradient_colors is None:
             gradient_colors = ct.COLORMAPS['viridis'][::-1]
-        air_color = lambda value: ct.interpolate(gradient_colors, param=value/peak)
-        peak = max(val for row in raster for val in row) or 1
-        value_to_color = lambda value: wall_color if value==(-1) else unreachable_color if value==(-2) else air_color(value)
+        values = Maze._raster_values(raster)
+        peak = max(values) or 1
+        air_colors = Maze._gradient_table(tuple(gradient_colors), peak)
+        value_to_color = lambda value: wall_color if value==(-1) else unreachable_color if value==(-2) else air_colors[value]
         # Convert to image
-        image = Maze._raster_to_image(raster, value_to_color)
+        image = Maze._raster_to_image(raster, value_to_color, values)
         image.filename = f"{self.name()}_colormap_{self._stamp()}.png"
         return image
 
@@ -850,6 +1906,9 @@ class Maze:
         - Kruskal: Goldenrod (yellow)
         - Wilson: Violet/Purple
         - Division: Light Gray
+        - XDivision: Periwinkle
+        - Tiled: Salmon
+        - Eller: Teal
 
         Args:
             raster (list(list(bool))): Custom raster map to be rendered
@@ -870,6 +1929,9 @@ class Maze:
             ct.GOLDENROD,
             ct.mix(ct.VIOLET,ct.PURPLE),
             ct.LIGHT_GRAY,
+            ct.PERIWINKLE,
+            ct.SALMON,
+            ct.TEAL,
         ]
         def value_to_color(value):
             if value==-1:
@@ -896,7 +1958,7 @@ class Maze:
         return image
 
     @staticmethod
-    def generate_animation(width, height, maze_runner, image_generator=None, frame_only=1, alert_progress_steps=0):
+    def generate_animation(width, height, maze_runner, image_generator=None, frame_only=1, alert_progress_steps=0, writer=None, parallel=False, max_workers=None):
         """Generate a list of Image objects showing an animation of a maze.
 
         The animation shows an algorithm working a blank maze.
@@ -910,47 +1972,76 @@ class Maze:
                 function to periodically call after changes have been made.
             image_generator (callable(Maze) -> PIL.Image): A function producing
                 the frames for the animation (default is
-                    lambda maze:
-                        maze.compute_distances() and()or
-                        maze.generate_colorimage(
-                            raster=maze.generate_raster(
-                                show_distances=True,
-                                wall_air_ratio=(1,3)
-                            )
-                        )
-                )
+                FrameRenderer(wall_air_ratio=(1,3)), which only repaints the
+                cells changed since the previous frame).
             frame_only (int): Determines to takes a screenshot every n-th frame.
                 (default is 1 (every frame)).
             alert_progress_steps (int): FIXME (vaguely: give feedback after
                 n-th part of the process).
+            writer (AnimationWriter): Writer to stream frames into as soon as
+                they are recorded, instead of collecting them (default is
+                None). Frames of a `FrameRenderer` with the writer's palette
+                are passed on without creating images.
+            parallel (bool): Whether to only record the changes of frames
+                while the maze is carved, and then render them in parallel by
+                worker processes (see `MutationLog`, `MazeReplay.render`),
+                which requires a picklable image_generator (default is False).
+                Frames are rendered serially anyway if only one worker
+                process would be used.
+            max_workers (int): Maximum number of worker processes when
+                rendering in parallel (default is os.cpu_count()).
 
         Returns:
             (list(PIL.Image),Maze): Animation and end result maze.
                 The first Image object has an additional `filename` attribute.
+                No frames are returned if a writer is given.
         """
         if image_generator is None:
-            #image_generator = lambda maze:maze.compute_distances() and()or maze.generate_colorimage(raster=maze.generate_raster(show_distances=True,wall_air_ratio=(1,3)))
-            image_generator = (lambda maze:
-                maze.generate_image(
-                    raster=maze.generate_raster(wall_air_ratio=(1,3))
-                )
-            )
+            image_generator = FrameRenderer(wall_air_ratio=(1,3))
         global counter, frames, n_progress_milestone
         counter = int()
         frames = list()
         frame_total = (width * height) // frame_only
         n_progress_milestone = frame_total//alert_progress_steps if alert_progress_steps > 0 else None
+        passes_pixels = (
+            writer is not None
+            and isinstance(image_generator, FrameRenderer)
+            and writer.palette == [tuple(color) for color in image_generator.wall_air_colors]
+        )
+        def add_image(image):
+            if writer is None:
+                frames.append(image)
+            else:
+                writer.write_image(image)
+        def render_frame(maze):
+            if passes_pixels:
+                repainted = image_generator.update(maze)
+                writer.write_frame(image_generator.pixels, box=image_generator.pixel_box(repainted))
+            else:
+                add_image(image_generator(maze))
+        maze = Maze(width,height)
+        parallel = parallel and (max_workers or os.cpu_count() or 1) > 1
+        if parallel:
+            log = MutationLog(maze)
+            add_frame = log.record_frame
+        else:
+            add_frame = render_frame
         def record_frame(maze):
-            global counter, frames
+            global counter
             counter += 1
             if counter % frame_only == 0:
-                frame = image_generator(maze)
-                frames.append(frame)
+                add_frame(maze)
                 if alert_progress_steps and counter//frame_only % n_progress_milestone == 0:
                     print(f"{counter} visits made (expect > {frame_total})")
-        maze = Maze(width,height)
         maze_runner(maze, record_frame)
-        frames.append(image_generator(maze))
+        add_frame(maze)
+        if parallel:
+            maze._log = None
+            replay = MazeReplay(log)
+            for image in replay.render(image_generator=image_generator, max_workers=max_workers):
+                add_image(image)
+        if writer is not None:
+            return (None, maze)
         frames[0].filename = f"{maze.name()}_anim_{maze._stamp()}.gif"
         return (frames, maze)
 
@@ -1050,7 +2141,8 @@ class Maze:
         tiles = " ╶╺╵└┕╹┖┗╴─╼┘┴┶┚┸┺╸╾━┙┵┷┛┹┻╷┌┍│├┝╿┞┡┐┬┮┤┼┾┦╀╄┑┭┯┥┽┿┩╃╇╻┎┏╽┟┢┃┠┣┒┰┲┧╁╆┨╂╊┓┱┳┪╅╈┫╉╋"
         make_tile = lambda a,b,c,d: tiles[27*d + 9*c + 3*b + 1*a]
         string = ""
-        for row in self._lattice:
+        for y in range(self.height):
+            row = self.nodes((0,y,self.width-1,y))
             string  += '\n'
             strbelow = "\n"
             for node in row:
@@ -1107,11 +2199,12 @@ class Maze:
         # Top-left corner
         linestr = [['+']]
         # Top wall
-        for node in self._lattice[0]:
+        for node in self.nodes((0,0,self.width-1,0)):
             linestr[0] += ['---' if node.has_wall(UP) else '   '] * air_ratio
             linestr[0] += ['+']
         # Middle and bottom rows of string
-        for row in self._lattice:
+        for y in range(self.height):
+            row = list(self.nodes((0,y,self.width-1,y)))
             # Left wall
             row1 = ['|' if row[0].has_wall(LEFT) else ' ']
             row2 = ['+']
@@ -1200,13 +2293,27 @@ class Maze:
                 string.append(trsfm2(cornersegment(x,y)))
         return ''.join(string)
 
+    def _random_generator(self, seed):
+        """Get random number generator for an algorithm from its `seed` arg.
+
+        Generators are used as given (e.g. by nested algorithm calls), other
+        seeds (drawn from `random` if None) are recorded in `self.seed` and
+        used to seed a new generator.
+        """
+        if isinstance(seed, random.Random):
+            return seed
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        return random.Random(seed)
+
     @staticmethod
     def _algorithm_name_to_id(string):
         """Canonically mapping str to int using ALGORITHMS (OrderedDict)."""
         return list(ALGORITHMS.keys()).index(string)
 
     @maze_algorithm
-    def clear(self, record_frame=None, area=None):
+    def clear(self, record_frame=None, area=None, seed=None):
         """Routine that clears a maze of its edges.
 
         Args:
@@ -1215,6 +2322,7 @@ class Maze:
             area (tuple(int,int,int,int)): Coordinates of upper left (x0,y0,..),
                 and bottom right (..,x1,y1) corners between which to execute
                 (default is (0,0, self.width-1,self.height-1)).
+            seed (int or random.Random): Unused, clearing is deterministic.
         """
         if area is None:
             area = (0,0,self.width-1,self.height-1)
@@ -1228,7 +2336,7 @@ class Maze:
         self._solution_nodes = None
 
     @maze_algorithm
-    def random_edges(self, record_frame=None, area=None, edge_probability=0.5):
+    def random_edges(self, record_frame=None, area=None, edge_probability=0.5, seed=None):
         """Routine that uniformly randomly assigns edges between nodes in grid.
 
         Args:
@@ -1238,20 +2346,24 @@ class Maze:
                 and bottom right (..,x1,y1) corners between which to execute
                 (default is (0,0, self.width-1,self.height-1)).
             edge_probability (float): Probability 0<=p<=1 with which to roll.
+            seed (int or random.Random): Seed for a new random number
+                generator, or generator to use directly (default is a fresh
+                seed). New seeds are recorded in `self.seed`.
         """
         alg_id = Maze._algorithm_name_to_id('random_edges')
         if record_frame is None:
             record_frame = lambda maze:None
+        rng = self._random_generator(seed)
         record_frame(self)
         for (node0,node1) in self.edges(area):
             node0._alg_id = node1._alg_id = alg_id
-            if random.random() < edge_probability:
+            if rng.random() < edge_probability:
                 self.connect(node0,node1)
                 record_frame(self)
         return
 
     @maze_algorithm
-    def growing_tree(self, record_frame=None, area=None, start_coord=None, name_and_index_choice=None, fast_pop=False):
+    def growing_tree(self, record_frame=None, area=None, start_coord=None, name_and_index_choice=None, fast_pop=True, seed=None):
         """Growing Tree algorithm to carve a maze.
 
         The algorithm works by having an active set of nodes at a time, and
@@ -1284,65 +2396,84 @@ class Maze:
                 a unique name
                 (default is
                     'growing_tree', lambda max_index:
-                        -1 if random.random()<0.95
+                        -1 if random.random()<0.70
                         else random.randint(0,max_index)
                 ).
-            fast_pop (bool): Activate small optimization, each switching chosen
-                element with last element in active set (list) when removing it
-                (default is False).
+            fast_pop (bool): Remove nodes from the active set in O(1) time.
+                Removals at either end keep the order of the active set, so
+                stack-like (-1) and queue-like (0) choices behave exactly as
+                described, any other removal moves the last element into
+                the gap. Order-preserving O(n) removal is used otherwise
+                (default is True).
+            seed (int or random.Random): Seed for a new random number
+                generator, or generator to use directly (default is a fresh
+                seed). New seeds are recorded in `self.seed`.
         """
         if area is None:
             area = (0,0,self.width-1,self.height-1)
         (x0,y0,x1,y1) = area
         if record_frame is None:
             record_frame = lambda maze:None
+        rng = self._random_generator(seed)
         if start_coord is None:
-            start_coord = (random.randint(x0,x1),random.randint(y0,y1))
+            start_coord = (rng.randint(x0,x1),rng.randint(y0,y1))
         if name_and_index_choice is None:
             name = 'growing_tree'
-            index_choice = lambda max_index: -1 if random.random()<0.70 else random.randint(0,max_index)
+            index_choice = lambda max_index: -1 if rng.random()<0.70 else rng.randint(0,max_index)
         else:
             (name,index_choice) = name_and_index_choice
             if name not in ALGORITHMS:
-                ALGORITHMS[name] = (lambda maze, area, record_frame:
+                ALGORITHMS[name] = (lambda maze, record_frame=None, area=None, seed=None:
                     Maze.growing_tree(
                         maze,
                         record_frame=record_frame,
                         area=area,
                         name_and_index_choice=name_and_index_choice,
+                        seed=seed,
                     )
                 )
         alg_id = Maze._algorithm_name_to_id(name)
-        start = self.node_at(*start_coord)
-        start.flag = True
-        start._alg_id = alg_id
+        (w, flags) = (self.width, self._flags)
+        start = self.node_at(*start_coord)._index
+        flags[start] = True
+        self._set_alg_id(start, alg_id)
+        # Active set of node indices, the nodes before `head` were removed
         active_set = [start]
+        head = 0
         record_frame(self)
-        while active_set:
-            idx = index_choice(len(active_set)-1)
-            node = active_set[idx]
-            if (neighbors:=[nbr for nbr in self.adjacent_to(node, area) if not nbr.flag]):
-                neighbor = random.choice(neighbors)
-                self.connect(node, neighbor)
-                neighbor.flag = True
-                neighbor._alg_id = alg_id
+        while len(active_set) > head:
+            idx = index_choice(len(active_set)-head-1)
+            pos = head+idx if idx >= 0 else len(active_set)+idx
+            index = active_set[pos]
+            (y,x) = divmod(index, w)
+            # Unvisited neighbors (left, right, up, down) by index offset
+            neighbors = []
+            if x0 < x and not flags[index-1]: neighbors.append(index-1)
+            if x < x1 and not flags[index+1]: neighbors.append(index+1)
+            if y0 < y and not flags[index-w]: neighbors.append(index-w)
+            if y < y1 and not flags[index+w]: neighbors.append(index+w)
+            if neighbors:
+                neighbor = rng.choice(neighbors)
+                self._connect_cells(index, neighbor)
+                flags[neighbor] = True
+                self._set_alg_id(neighbor, alg_id)
                 active_set.append(neighbor)
                 record_frame(self)
+            elif not fast_pop:
+                active_set.pop(pos)
+            elif pos == len(active_set)-1:
+                active_set.pop()
+            elif pos == head:
+                head += 1
+                if head > len(active_set) // 2:
+                    del active_set[:head]
+                    head = 0
             else:
-                if fast_pop:
-                    if len(active_set) > 1 and idx != -1:
-                        (
-                            active_set[idx], active_set[-1]
-                        ) = (
-                            active_set[-1],  active_set[idx]
-                        )
-                    active_set.pop()
-                else:
-                    active_set.pop(idx)
+                active_set[pos] = active_set.pop()
         return
 
     @maze_algorithm
-    def backtracker(self, record_frame=None, area=None, start_coord=None):
+    def backtracker(self, record_frame=None, area=None, start_coord=None, seed=None):
         """Depth-First-Search like 'backtracker' algorithm to produce rndm maze.
 
         See `growing_tree` algorithm.
@@ -1355,6 +2486,9 @@ class Maze:
                 (default is (0,0, self.width-1,self.height-1)).
             start_coord (int,int): Coordinates 0<=x<width && 0<=y<height from
                 which to start the alg. (default is uniformly random choice).
+            seed (int or random.Random): Seed for a new random number
+                generator, or generator to use directly (default is a fresh
+                seed). New seeds are recorded in `self.seed`.
         """
         self.growing_tree(
             record_frame=record_frame,
@@ -1364,11 +2498,12 @@ class Maze:
                 'backtracker',
                 (lambda max_index: -1),
             ),
+            seed=seed,
         )
         return
 
     @maze_algorithm
-    def prim(self, record_frame=None, area=None, start_coord=None):
+    def prim(self, record_frame=None, area=None, start_coord=None, seed=None):
         """'Simplified Prim' algorithm to produce random maze.
 
         See `growing_tree` algorithm.
@@ -1381,22 +2516,25 @@ class Maze:
                 (default is (0,0, self.width-1,self.height-1)).
             start_coord (int,int): Coordinates 0<=x<width && 0<=y<height from
                 which to start the alg. (default is uniformly random choice).
-            start_coord (int,int): Coordinates 0<=x<width && 0<=y<height from
-                which to start the alg. (default is uniformly random choice).
+            seed (int or random.Random): Seed for a new random number
+                generator, or generator to use directly (default is a fresh
+                seed). New seeds are recorded in `self.seed`.
         """
+        rng = self._random_generator(seed)
         self.growing_tree(
             record_frame=record_frame,
             area=area,
             start_coord=start_coord,
             name_and_index_choice=(
                 'prim',
-                (lambda max_index: random.randint(0,max_index)),
+                (lambda max_index: rng.randint(0,max_index)),
             ),
+            seed=rng,
         )
         return
 
     @maze_algorithm
-    def kruskal(self, record_frame=None, area=None):
+    def kruskal(self, record_frame=None, area=None, seed=None):
         """Randomized Kruskal's algorithm to produce random maze.
 
         Args:
@@ -1405,40 +2543,66 @@ class Maze:
             area (tuple(int,int,int,int)): Coordinates of upper left (x0,y0,..),
                 and bottom right (..,x1,y1) corners between which to execute
                 (default is (0,0, self.width-1,self.height-1)).
+            seed (int or random.Random): Seed for a new random number
+                generator, or generator to use directly (default is a fresh
+                seed). New seeds are recorded in `self.seed`.
         """
         alg_id = Maze._algorithm_name_to_id('kruskal')
         if area is None:
-            nodecount = self.width * self.height
-        else:
-            nodecount = (area[2]-area[0]+1) * (area[3]-area[1]+1)
+            area = (0,0,self.width-1,self.height-1)
+        (x0,y0,x1,y1) = area
         if record_frame is None:
             record_frame = lambda maze:None
-        edges = list(self.edges(area))
-        random.shuffle(edges)
-        members = dict()
+        rng = self._random_generator(seed)
+        (w, aw, ah) = (self.width, x1-x0+1, y1-y0+1)
+        nodecount = aw * ah
+        base = y0*w + x0
+        # Edges are encoded by 2*(index of upper/left node in area) + vertical
+        edges = array.array('l', (
+            2*(y*aw+x) for y in range(ah) for x in range(aw-1)
+        ))
+        edges.extend(
+            2*(y*aw+x)+1 for y in range(ah-1) for x in range(aw)
+        )
+        rng.shuffle(edges)
+        # Disjoint-set forest over node indices in area
+        parent = array.array('l', range(nodecount))
+        rank = bytearray(nodecount)
+        components = nodecount
         record_frame(self)
-        for (node0,node1) in edges:
-            node0._alg_id = node1._alg_id = alg_id
-            if not all([node0.flag,node1.flag]) or node0.flag != node1.flag:
-                if not node0.flag:
-                    node0.flag, members[node0] = node0, [node0]
-                if not node1.flag:
-                    node1.flag, members[node1] = node1, [node1]
-                self.connect(node0, node1)
-                record_frame(self)
-                if len(members[node0.flag]) < len(members[node1.flag]):
-                    smaller,bigger = node0,node1
+        for code in edges:
+            if components == 1:
+                break
+            index0 = code >> 1
+            index1 = index0 + (aw if code & 1 else 1)
+            (y,x) = divmod(index0, aw)
+            global0 = base + y*w + x
+            global1 = global0 + (w if code & 1 else 1)
+            self._set_alg_id(global0, alg_id)
+            self._set_alg_id(global1, alg_id)
+            # Find roots (with path halving)
+            root0 = index0
+            while parent[root0] != root0:
+                parent[root0] = root0 = parent[parent[root0]]
+            root1 = index1
+            while parent[root1] != root1:
+                parent[root1] = root1 = parent[parent[root1]]
+            if root0 != root1:
+                # Union by rank
+                if rank[root0] < rank[root1]:
+                    parent[root0] = root1
+                elif rank[root0] > rank[root1]:
+                    parent[root1] = root0
                 else:
-                    smaller,bigger = node1,node0
-                for node in members[smaller.flag]:
-                    node.flag = bigger.flag
-                    members[bigger.flag].append(node)
-                if len(members[bigger.flag])==nodecount:
-                    break
+                    parent[root1] = root0
+                    rank[root0] += 1
+                components -= 1
+                self._connect_cells(global0, global1)
+                record_frame(self)
         return
 
     @maze_algorithm
-    def wilson(self, record_frame=None, area=None, start_coord=None):
+    def wilson(self, record_frame=None, area=None, start_coord=None, seed=None):
         """Wilson's uniform random spanning tree algorithm to make a rndm maze.
 
         Args:
@@ -1449,6 +2613,9 @@ class Maze:
                 (default is (0,0, self.width-1,self.height-1)).
             start_coord (int,int): Coordinates 0<=x<width && 0<=y<height from
                 which to start the alg. (default is uniformly random choice).
+            seed (int or random.Random): Seed for a new random number
+                generator, or generator to use directly (default is a fresh
+                seed). New seeds are recorded in `self.seed`.
         """
         alg_id = Maze._algorithm_name_to_id('wilson')
         if area is None:
@@ -1456,6 +2623,7 @@ class Maze:
         (x0,y0,x1,y1) = area
         if record_frame is None:
             record_frame = lambda maze:None
+        rng = self._random_generator(seed)
         def backtrack_path(tail_node, origin):
             while tail_node != origin:
                 prev_node = next(self.connected_to(tail_node, area))
@@ -1469,7 +2637,7 @@ class Maze:
         nodes = list(self.nodes(area))
         generation = 1
         start.flag = generation
-        random.shuffle(nodes)
+        rng.shuffle(nodes)
         record_frame(self)
         for node in nodes:
             node._alg_id = alg_id
@@ -1478,7 +2646,7 @@ class Maze:
                 node.flag = generation
                 curr_node = node
                 while True:
-                    next_node = random.choice(list(self.adjacent_to(curr_node, area)))
+                    next_node = rng.choice(list(self.adjacent_to(curr_node, area)))
                     if not next_node.flag:
                         next_node.flag = generation
                         self.connect(curr_node, next_node)
@@ -1495,7 +2663,7 @@ class Maze:
         return
 
     @maze_algorithm
-    def division(self, record_frame=None, area=None, slice_direction_choice=None, pivot_choice=None, roomlength=0, nest_algorithms=[]):
+    def division(self, record_frame=None, area=None, slice_direction_choice=None, pivot_choice=None, roomlength=0, nest_algorithms=[], seed=None):
         """Divide-and-conquer approach to making a random maze.
 
         Customizable through choice of direction and position of area cut.
@@ -1523,23 +2691,28 @@ class Maze:
             roomlength (int): Maximum sidel ength of rooms to randomly leave
                 open/fill recursively (default is 0).
             nest_algorithms (
-                list(callable(Maze, tuple(int,int,int,int), callable(Maze)))
+                list(callable(Maze, callable(Maze), tuple(int,int,int,int)))
                 ): List of recursively callable maze algorithms.
                 To qualify, an algorithm must accept a maze to modify,
-                an area to selectively carve and a record_frame for snapshots.
+                a record_frame for snapshots, an area to selectively carve and
+                a random number generator as `seed`.
+            seed (int or random.Random): Seed for a new random number
+                generator, or generator to use directly (default is a fresh
+                seed). New seeds are recorded in `self.seed`.
         """
         alg_id = Maze._algorithm_name_to_id('division')
         if area is None:
             area = (0,0,self.width-1,self.height-1)
         if record_frame is None:
             record_frame = lambda maze:None
+        rng = self._random_generator(seed)
         if pivot_choice is None:
             #pivot_choice = lambda l,r: (l+r)//2
-            pivot_choice = lambda l,r: min(max(l,int(random.gauss((l+r)/2,(l+r)/2**7))),r)
+            pivot_choice = lambda l,r: min(max(l,int(rng.gauss((l+r)/2,(l+r)/2**7))),r)
             #pivot_choice = lambda l,r: random.triangular(l,r)
             #pivot_choice = lambda l,r: random.randint(l,r)
         if slice_direction_choice is None:
-            slice_direction_choice = lambda w,h, prev: h > w if h != w else random.getrandbits(1)
+            slice_direction_choice = lambda w,h, prev: h > w if h != w else rng.getrandbits(1)
             #slice_direction_choice = lambda w,h, prev: prev ^ (random.random() < 1.9)
             #slice_direction_choice = lambda w,h, prev: random.getrandbits(1)
         def divide(area, prev_dir):
@@ -1550,7 +2723,7 @@ class Maze:
             event_room = (
                 roomlength > 0
                 and ewidth <= roomlength and eheight <= roomlength
-                and random.random() < 1/(ewidth*eheight)**.5
+                and rng.random() < 1/(ewidth*eheight)**.5
             )
             if room1 or (event_room and not nest_algorithms):
                 for x in range(x0,x1+1):
@@ -1565,12 +2738,12 @@ class Maze:
                         record_frame(self)
                 return
             elif event_room:
-                random.choice(nest_algorithms)(self, record_frame, area)
+                rng.choice(nest_algorithms)(self, record_frame=record_frame, area=area, seed=rng)
                 return
             cut_horizontally = slice_direction_choice(ewidth, eheight, prev_dir)
             if cut_horizontally:
                 yP = pivot_choice(y0,y1-1)
-                x = random.randint(x0,x1)
+                x = rng.randint(x0,x1)
                 if not nest_algorithms:
                     self.node_at(x,yP)._alg_id = alg_id
                     self.node_at(x,yP+1)._alg_id = alg_id
@@ -1580,7 +2753,7 @@ class Maze:
                 divide((x0,yP+1,x1,y1), True)
             else:
                 xP = pivot_choice(x0,x1-1)
-                y = random.randint(y0,y1)
+                y = rng.randint(y0,y1)
                 if not nest_algorithms:
                     self.node_at(xP,y)._alg_id = alg_id
                     self.node_at(xP+1,y)._alg_id = alg_id
@@ -1593,7 +2766,7 @@ class Maze:
         return
 
     @maze_algorithm
-    def xdivision(self, record_frame=None, area=None, roomlength=0):
+    def xdivision(self, record_frame=None, area=None, roomlength=0, seed=None):
         """Div&Cqr to make a random maze with other recursive algorithm calls.
 
         Args:
@@ -1602,6 +2775,9 @@ class Maze:
             area (tuple(int,int,int,int)): Coordinates of upper left (x0,y0,..),
                 and bottom right (..,x1,y1) corners between which to execute
                 (default is (0,0, self.width-1,self.height-1)).
+            seed (int or random.Random): Seed for a new random number
+                generator, or generator to use directly (default is a fresh
+                seed). New seeds are recorded in `self.seed`.
         """
         self.division(
             record_frame=record_frame,
@@ -1609,13 +2785,159 @@ class Maze:
             roomlength=float('inf'),
             nest_algorithms=[
                 alg for name,alg in ALGORITHMS.items() if name not in {
-                    'random_edges', 'xdivision'
+                    'random_edges', 'xdivision', 'tiled'
                 }
             ],
+            seed=seed,
+        )
+        return
+
+    @maze_algorithm
+    def tiled(self, record_frame=None, area=None, tile_size=256, tile_algorithm='backtracker', max_workers=None, seed=None):
+        """Carve tiles of a maze in parallel processes and stitch them together.
+
+        The area is split into square tiles which are carved independently by
+        worker processes directly into shared memory. A randomized Kruskal pass
+        over the (small) grid of tiles then opens one wall between tiles until
+        they form a single perfect maze.
+        Frames are only recorded before/after carving tiles and while stitching.
+
+        Args:
+            record_frame (callable(Maze)): Function to take snapshot of maze
+                periodically (default is lambda _: None).
+            area (tuple(int,int,int,int)): Coordinates of upper left (x0,y0,..),
+                and bottom right (..,x1,y1) corners between which to execute
+                (default is (0,0, self.width-1,self.height-1)).
+            tile_size (int): Side length of tiles (default is 256).
+            tile_algorithm (str): Name of an algorithm in ALGORITHMS producing
+                perfect mazes, to carve tiles with (default is 'backtracker').
+            max_workers (int): Maximum number of worker processes (default is
+                os.cpu_count()).
+            seed (int or random.Random): Seed for a new random number
+                generator, or generator to use directly (default is a fresh
+                seed). New seeds are recorded in `self.seed`.
+        """
+        if area is None:
+            area = (0,0,self.width-1,self.height-1)
+        (x0,y0,x1,y1) = area
+        if record_frame is None:
+            record_frame = lambda maze:None
+        rng = self._random_generator(seed)
+        (w, aw, ah) = (self.width, x1-x0+1, y1-y0+1)
+        # Tiles in area-local coordinates
+        tile_xs = range(0, aw, tile_size)
+        tile_ys = range(0, ah, tile_size)
+        tiles = [
+            (tx, ty, min(tx+tile_size,aw)-1, min(ty+tile_size,ah)-1)
+            for ty in tile_ys for tx in tile_xs
+        ]
+        record_frame(self)
+        if len(tiles) == 1:
+            ALGORITHMS[tile_algorithm](self, record_frame=record_frame, area=area, seed=rng)
+            return
+        # Carve tiles into shared memory in parallel
+        edges_memory = shared_memory.SharedMemory(create=True, size=aw*ah)
+        alg_ids_memory = shared_memory.SharedMemory(create=True, size=2*aw*ah)
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+                list(executor.map(
+                    _carve_tile,
+                    itertools.repeat(edges_memory.name),
+                    itertools.repeat(alg_ids_memory.name),
+                    itertools.repeat(aw),
+                    tiles,
+                    itertools.repeat(tile_algorithm),
+                    [rng.getrandbits(64) for _ in tiles],
+                ))
+            for y in range(ah):
+                index = (y0+y)*w + x0
+                self._write_cells(
+                    index,
+                    edges=array.array('B', bytes(edges_memory.buf[y*aw:(y+1)*aw])),
+                    alg_ids=array.array('H', bytes(alg_ids_memory.buf[2*y*aw:2*(y+1)*aw])),
+                )
+        finally:
+            for memory in (edges_memory, alg_ids_memory):
+                memory.close()
+                memory.unlink()
+        record_frame(self)
+        # Stitch tiles together by Kruskal's algorithm on the grid of tiles
+        (columns, rows) = (len(tile_xs), len(tile_ys))
+        tile_edges = (
+            [(t, t+1, RIGHT) for t in range(columns*rows) if t % columns != columns-1]
+            + [(t, t+columns, DOWN) for t in range(columns*(rows-1))]
         )
+        rng.shuffle(tile_edges)
+        parent = list(range(columns*rows))
+        def find(t):
+            while parent[t] != t:
+                parent[t] = t = parent[parent[t]]
+            return t
+        for (tile0, tile1, direction) in tile_edges:
+            (root0, root1) = (find(tile0), find(tile1))
+            if root0 == root1:
+                continue
+            parent[root0] = root1
+            (tx0,ty0,tx1,ty1) = tiles[tile0]
+            if direction == RIGHT: # Open wall on vertical border
+                (x, y) = (tx1, rng.randint(ty0,ty1))
+                index = (y0+y)*w + x0+x
+                self._connect_cells(index, index+1)
+            else: # Open wall on horizontal border
+                (x, y) = (rng.randint(tx0,tx1), ty1)
+                index = (y0+y)*w + x0+x
+                self._connect_cells(index, index+w)
+            record_frame(self)
         return
 
-    def make_braided(self, record_frame=None, area=None, probability=1.0, use_trick=True, criterion=None):
+    @maze_algorithm
+    def eller(self, record_frame=None, area=None, horizontal_probability=0.5, vertical_probability=0.5, seed=None):
+        """Eller's algorithm to produce a random maze one row at a time.
+
+        See `eller_rows`, which can also stream rows without a `Maze` object.
+
+        Args:
+            record_frame (callable(Maze)): Function to take snapshot of maze
+                periodically (default is lambda _: None).
+            area (tuple(int,int,int,int)): Coordinates of upper left (x0,y0,..),
+                and bottom right (..,x1,y1) corners between which to execute
+                (default is (0,0, self.width-1,self.height-1)).
+            horizontal_probability (float): Probability 0<=p<=1 to join two
+                horizontally adjacent nodes of different sets (default is 0.5).
+            vertical_probability (float): Probability 0<=p<=1 to connect a
+                node downwards, besides one node per set (default is 0.5).
+            seed (int or random.Random): Seed for a new random number
+                generator, or generator to use directly (default is a fresh
+                seed). New seeds are recorded in `self.seed`.
+        """
+        alg_id = Maze._algorithm_name_to_id('eller')
+        if area is None:
+            area = (0,0,self.width-1,self.height-1)
+        (x0,y0,x1,y1) = area
+        if record_frame is None:
+            record_frame = lambda maze:None
+        rng = self._random_generator(seed)
+        (w, aw, ah) = (self.width, x1-x0+1, y1-y0+1)
+        rows = eller_rows(
+            aw, ah,
+            horizontal_probability=horizontal_probability,
+            vertical_probability=vertical_probability,
+            packed=False,
+            seed=rng,
+        )
+        record_frame(self)
+        for (y,row) in enumerate(rows, start=y0):
+            base = y*w + x0
+            self._write_cells(base, alg_ids=array.array('H', [alg_id]) * aw)
+            for (x,edges) in enumerate(row, start=base):
+                if edges & RIGHT:
+                    self._connect_cells(x, x+1)
+                if edges & DOWN:
+                    self._connect_cells(x, x+w)
+            record_frame(self)
+        return
+
+    def make_braided(self, record_frame=None, area=None, probability=1.0, use_trick=True, criterion=None, seed=None):
         """Convert maze into a braided maze.
 
         A braided maze has no dead ends (and only cycles), the conversion
@@ -1633,11 +2955,15 @@ class Maze:
                 everytime (default is True).
             criterion (callable(Node) -> bool): Additional criterion to decide
                 whether to connect dead end (default is lambda _: True).
+            seed (int or random.Random): Seed for a new random number
+                generator, or generator to use directly (default is a fresh
+                seed). New seeds are recorded in `self.seed`.
         """
         if area is None:
             area = (0,0,self.width-1,self.height-1)
         if record_frame is None:
             record_frame = lambda maze:None
+        rng = self._random_generator(seed)
         if criterion is None:
             criterion = lambda _: True
             #criterion = lambda node: self._branch_distance(node) <= 1
@@ -1647,7 +2973,7 @@ class Maze:
             return is_dead_end(node) and criterion(node)
         for node in self.nodes(area):
             # Decide whether to connect node
-            if qualifies(node) and random.random() < probability:
+            if qualifies(node) and rng.random() < probability:
                 # Add connections until we have at least two
                 while qualifies(node):
                     neighbors = list(self.connected_to(node,invert=True))
@@ -1656,15 +2982,968 @@ class Maze:
                         dead_end_neighbors = [
                             n for n in neighbors if is_dead_end(n)]
                         neighbors = dead_end_neighbors or neighbors
-                    self.connect(node,random.choice(neighbors))
+                    self.connect(node,rng.choice(neighbors))
                     record_frame(self)
         return
 
+class FrameRenderer:
+    """
+    Render animation frames of a maze by repainting only the cells changed
+    since the previous frame.
+
+    The first frame of a maze is drawn in full into a persistent buffer of
+    palette indices, after which the renderer has the maze collect changed
+    cell indices (see `Maze._dirty`). Each later frame only repaints the wall
+    blocks of those cells, so recording a frame costs time proportional to
+    the cells carved since the last one rather than to the whole maze.
+    Frames look like `generate_image(raster=generate_raster(wall_air_ratio))`.
+    """
+
+    def __init__(self, wall_air_ratio=(1,1), wall_air_colors=(ct.BLACK,ct.WHITE)):
+        """Set up a renderer, which can be called like an `image_generator`.
+
+        Args:
+            wall_air_ratio (tuple(int,int)): Thickness of wall and air parts.
+            wall_air_colors (tuple(tuple(int,int,int),tuple(int,int,int))):
+                RGB integer color tuples for the wall- and air pixel colors,
+                respectively (default is (ct.BLACK,ct.WHITE)).
+        """
+        self.wall_air_ratio = wall_air_ratio
+        self.wall_air_colors = wall_air_colors
+        self._maze = None
+        self._buffer = None
+        self._size = None
+
+    def __call__(self, maze):
+        """Update the frame buffer to the current maze state.
+
+        Args:
+            maze (Maze): Maze to render, which starts tracking its changes
+                if it is not the maze of the previous frame.
+
+        Returns:
+            PIL.Image: Palette image of the frame.
+        """
+        self.update(maze)
+        image = Image.frombytes('P', self._size, self._buffer)
+        image.putpalette(b''.join(bytes(color) for color in self.wall_air_colors))
+        return image
+
+    @property
+    def pixels(self):
+        """bytearray: Frame buffer of palette indices (not to be modified)."""
+        return self._buffer
+
+    def frame_size(self, width, height):
+        """Compute the pixel dimensions of frames of a maze of given size."""
+        (wallM, airM) = self.wall_air_ratio
+        return (wallM + width*(wallM+airM), wallM + height*(wallM+airM))
+
+    def update(self, maze):
+        """Bring the frame buffer up to date without producing an image.
+
+        Args:
+            maze (Maze): Maze to render.
+
+        Returns:
+            set(int): Indices of the cells repainted (all cells on a full
+                repaint).
+        """
+        if maze is not self._maze or maze._dirty is None:
+            self._repaint_all(maze)
+            return set(range(maze.width * maze.height))
+        dirty = maze._dirty
+        maze._dirty = set()
+        for index in dirty:
+            self._repaint_cell(maze, index)
+        return dirty
+
+    def pixel_box(self, indices):
+        """Compute the pixel box (x0,y0, x1,y1) covering repaints of cells.
+
+        Args:
+            indices (iterable(int)): Cell indices, e.g. as returned by `update`.
+
+        Returns:
+            tuple(int,int,int,int): Box, end exclusive (empty if there are no
+                cells).
+        """
+        w = self._maze.width
+        coordinates = [divmod(index, w) for index in indices]
+        if not coordinates:
+            return (0, 0, 0, 0)
+        (wallM, airM) = self.wall_air_ratio
+        period = wallM + airM
+        (ys, xs) = zip(*coordinates)
+        # Cells repaint their right and bottom walls (and outer left/top walls)
+        return (min(xs)*period, min(ys)*period, (max(xs)+1)*period + wallM, (max(ys)+1)*period + wallM)
+
+    def _repaint_all(self, maze):
+        """Draw the whole maze into a fresh frame buffer and start tracking."""
+        (w, h) = (maze.width, maze.height)
+        self._maze = maze
+        self._size = self.frame_size(w, h)
+        self._buffer = bytearray()
+        rows = (maze._edges[y*w:(y+1)*w].tobytes() for y in range(h))
+        for (pixels,repeat) in Maze._pixel_rows(w, h, rows, self.wall_air_ratio, False, False):
+            self._buffer += pixels * repeat
+        maze._dirty = set()
+        return
+
+    def _repaint_cell(self, maze, index):
+        """Repaint the walls of a cell that are decided by its own edges."""
+        (wallM, airM) = self.wall_air_ratio
+        period = wallM + airM
+        (buffer, stride) = (self._buffer, self._size[0])
+        (y,x) = divmod(index, maze.width)
+        edges = maze._edges[index]
+        (px, py) = (wallM + x*period, wallM + y*period)
+        def fill(x0, y0, width, height, direction):
+            """Paint a rectangle as air if the cell has an edge in direction."""
+            pixels = (b'\1' if edges & direction else b'\0') * width
+            for start in range(y0*stride + x0, (y0+height)*stride, stride):
+                buffer[start:start+width] = pixels
+        if wallM:
+            fill(px+airM, py, wallM, airM, RIGHT)
+            fill(px, py+airM, airM, wallM, DOWN)
+            if x == 0:
+                fill(0, py, wallM, airM, LEFT)
+            if y == 0:
+                fill(px, 0, airM, wallM, UP)
+        return
+
+class PNGWriter:
+    """
+    Write an indexed-color PNG image incrementally, row by row.
+
+    Rows are compressed as soon as they are written, so memory use is bounded
+    by the rows passed in (and zlib's window), not by the whole image.
+    """
+
+    _SIGNATURE = b'\x89PNG\r\n\x1a\n'
+    _IHDR = struct.Struct('>IIBBBBB')
+    _CHUNK_SIZE = 1 << 16
+    """Size of compressed data to collect before writing an IDAT chunk."""
+
+    def __init__(self, file, width, height, palette, compression_level=6):
+        """Start a PNG image by writing its header and palette.
+
+        Args:
+            file (str or binary file): Location of file to write, or file
+                object to write into (which is left open).
+            width, height (int): Positive integer dimensions of image.
+            palette (list(tuple(int,int,int))): RGB integer color tuples, at
+                most 256, indexed by pixel values.
+            compression_level (int): zlib compression level (default is 6).
+        """
+        if not (width > 0 and height > 0):
+            raise ValueError("Image must have positive width and height")
+        if not (0 < len(palette) <= 256):
+            raise ValueError("Palette must have between 1 and 256 colors")
+        self._owns_file = isinstance(file, str)
+        self._file = open(file,'wb') if self._owns_file else file
+        self.width = width
+        self.height = height
+        self._rows_written = 0
+        self._compressor = zlib.compressobj(compression_level)
+        self._pending = bytearray()
+        self._file.write(PNGWriter._SIGNATURE)
+        # Color type 3 (indexed), bit depth 8
+        self._write_chunk(b'IHDR', PNGWriter._IHDR.pack(width, height, 8, 3, 0, 0, 0))
+        self._write_chunk(b'PLTE', b''.join(bytes(color) for color in palette))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        elif self._owns_file:
+            self._file.close()
+        return False
+
+    @staticmethod
+    def _chunk(tag, data):
+        """Encode one PNG chunk (length, tag, data, checksum)."""
+        return b''.join((
+            struct.pack('>I', len(data)),
+            tag,
+            data,
+            struct.pack('>I', zlib.crc32(data, zlib.crc32(tag))),
+        ))
+
+    def _write_chunk(self, tag, data):
+        """Write one PNG chunk (length, tag, data, checksum)."""
+        self._file.write(PNGWriter._chunk(tag, data))
+        return
+
+    def write_row(self, pixels, repeat=1):
+        """Append a pixel row to the image.
+
+        Args:
+            pixels (bytes-like): One palette index per pixel.
+            repeat (int): Number of times to write the row (default is 1).
+        """
+        if len(pixels) != self.width:
+            raise ValueError(f"row must have {self.width} pixels, not {len(pixels)}")
+        if self._rows_written + repeat > self.height:
+            raise ValueError(f"image only has {self.height} rows")
+        # Every row is prefixed by filter type 0 (none)
+        self._pending += self._compressor.compress((b'\0' + bytes(pixels)) * repeat)
+        self._rows_written += repeat
+        if len(self._pending) >= PNGWriter._CHUNK_SIZE:
+            self._write_chunk(b'IDAT', bytes(self._pending))
+            self._pending.clear()
+        return
+
+    def close(self):
+        """Finish the image, which must have all its rows written."""
+        if self._rows_written != self.height:
+            raise ValueError(f"got {self._rows_written} rows instead of {self.height}")
+        self._pending += self._compressor.flush()
+        self._write_chunk(b'IDAT', bytes(self._pending))
+        self._pending.clear()
+        self._write_chunk(b'IEND', b'')
+        if self._owns_file:
+            self._file.close()
+        return
+
+class AnimationWriter:
+    """
+    Write an animation frame by frame, as GIF, APNG or raw RGB video.
+
+    Frames are encoded as soon as they are written, so memory use is bounded
+    by a single frame regardless of the length of the animation: the previous
+    frame is only kept to find what changed, and the last encoded frame is
+    held back to merge identical successive frames into one longer frame.
+    Raw video is a plain concatenation of `rgb24` frames as understood by
+    e.g. `ffmpeg -f rawvideo -pix_fmt rgb24 -s WxH -i -`.
+
+    In delta mode, frames after the first only encode the bounding box of
+    the pixels that changed, placed at an offset over the previous frame.
+    GIF deltas additionally make unchanged pixels inside the box transparent
+    (if the palette leaves room for a transparent color), which compresses
+    much better.
+    """
+
+    FORMATS = ('gif', 'apng', 'raw')
+    _ACTL = struct.Struct('>II')
+    _FCTL = struct.Struct('>IIIIIHHBB')
+    _SAME_TO_MASK = bytes([0xFF]) + bytes(255)
+    """Translation of XORed pixel bytes to 0xFF where they were equal."""
+
+    def __init__(self, file, width, height, palette=None, format=None, duration=30, loop=0, delta=False, compression_level=6):
+        """Start an animation by writing its header.
+
+        Args:
+            file (str or binary file): Location of file to write, or file
+                object to write into (which is left open).
+            width, height (int): Positive integer dimensions of frames.
+            palette (list(tuple(int,int,int))): RGB integer color tuples, at
+                most 256, indexed by pixel values (default is None, meaning
+                frames are given as RGB pixels).
+            format (str): One of `AnimationWriter.FORMATS` (default is
+                inferred from the file extension, raw for file objects).
+            duration (int): Milliseconds each frame is shown (default is 30).
+            loop (int): Number of times to loop the animation, 0 for forever,
+                None for playing once (default is 0).
+            delta (bool): Whether to only encode the changed part of frames
+                after the first (default is False, unsupported for raw).
+            compression_level (int): zlib compression level for APNG
+                (default is 6).
+        """
+        if not (width > 0 and height > 0):
+            raise ValueError("Animation must have positive width and height")
+        if palette is not None and not (0 < len(palette) <= 256):
+            raise ValueError("Palette must have between 1 and 256 colors")
+        if format is None:
+            extension = os.path.splitext(file)[1].lower() if isinstance(file, str) else ''
+            format = {'.gif':'gif', '.png':'apng', '.apng':'apng'}.get(extension, 'raw')
+        if format not in AnimationWriter.FORMATS:
+            raise ValueError(f"format must be one of {AnimationWriter.FORMATS}")
+        if delta and format == 'raw':
+            raise ValueError("raw video cannot hold delta frames")
+        self._owns_file = isinstance(file, str)
+        self._file = open(file,'wb') if self._owns_file else file
+        if format == 'apng' and not self._file.seekable():
+            raise ValueError("APNG needs a seekable file to patch in the frame count")
+        self.width = width
+        self.height = height
+        self.palette = None if palette is None else [tuple(color) for color in palette]
+        self.format = format
+        self.duration = duration
+        self.loop = loop
+        self.delta = delta
+        self.frame_count = 0
+        self._compression_level = compression_level
+        self._depth = 1 if palette is not None else 3 # Bytes per pixel
+        self._palette_bytes = None if palette is None else b''.join(bytes(color) for color in self.palette)
+        self._palette_image = None
+        # Palette index for unchanged pixels of GIF delta frames
+        self._transparency = (
+            len(palette) if delta and format == 'gif' and palette is not None and len(palette) < 256
+            else None
+        )
+        self._previous = None # Pixels of the last frame written
+        self._pending = None # Last frame, yet to be encoded: (box, pixels, duration, transparent)
+        self._sequence = 0 # APNG sequence number of fcTL and fdAT chunks
+        if format == 'gif':
+            self._write_gif_header()
+        elif format == 'apng':
+            self._write_apng_header()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        elif self._owns_file:
+            self._file.close()
+        return False
+
+    def _write_gif_header(self):
+        """Write the GIF header, global color table and loop extension."""
+        if self.palette is None:
+            flags = 0
+            table = b''
+        else:
+            colors = len(self.palette) + (self._transparency is not None)
+            bits = max(1, (colors-1).bit_length())
+            flags = 0x80 | (bits-1)
+            table = self._palette_bytes.ljust(3 << bits, b'\0')
+        self._file.write(b'GIF89a' + struct.pack('<HHBBB', self.width, self.height, flags, 0, 0) + table)
+        if self.loop is not None:
+            self._file.write(b'!\xff\x0bNETSCAPE2.0\x03\x01' + struct.pack('<H', self.loop) + b'\0')
+        return
+
+    def _write_apng_header(self):
+        """Write the PNG header, palette and a placeholder animation control."""
+        color_type = 2 if self.palette is None else 3
+        self._file.write(PNGWriter._SIGNATURE)
+        self._file.write(PNGWriter._chunk(b'IHDR', PNGWriter._IHDR.pack(self.width, self.height, 8, color_type, 0, 0, 0)))
+        if self.palette is not None:
+            self._file.write(PNGWriter._chunk(b'PLTE', self._palette_bytes))
+        self._actl_position = self._file.tell()
+        self._write_actl()
+        return
+
+    def _write_actl(self):
+        """Write the animation control chunk with the current frame count."""
+        num_plays = 1 if self.loop is None else self.loop
+        self._file.write(PNGWriter._chunk(b'acTL', AnimationWriter._ACTL.pack(self.frame_count, num_plays)))
+        return
+
+    def write_frame(self, pixels, duration=None, box=None):
+        """Append a frame to the animation.
+
+        Args:
+            pixels (bytes-like): One palette index per pixel, or three RGB
+                bytes per pixel if the writer has no palette, row by row.
+            duration (int): Milliseconds to show the frame (default is
+                self.duration).
+            box (tuple(int,int,int,int)): Pixel box (x0,y0, x1,y1), end
+                exclusive, outside of which the frame is known to equal the
+                previous one, e.g. from `FrameRenderer.pixel_box` (default is
+                None, meaning the whole frame is compared).
+        """
+        (w, h, depth) = (self.width, self.height, self._depth)
+        if len(pixels) != w*h*depth:
+            raise ValueError(f"frame must have {w*h*depth} bytes, not {len(pixels)}")
+        if duration is None:
+            duration = self.duration
+        if self.format == 'raw':
+            self._write_raw(pixels)
+            return
+        if self._previous is None:
+            self._previous = bytearray(pixels)
+            self._pending = ((0, 0, w, h), bytes(pixels), duration, False)
+            return
+        changed = self._changed_box(pixels, box)
+        if changed is None:
+            # Show the last frame for longer instead
+            (box, data, pending_duration, transparent) = self._pending
+            self._pending = (box, data, pending_duration + duration, transparent)
+            return
+        self._encode(*self._pending)
+        if not self.delta:
+            changed = (0, 0, w, h)
+        (x0, y0, x1, y1) = changed
+        transparent = self._transparency is not None
+        rows = []
+        for y in range(y0, y1):
+            (start, end) = ((y*w + x0)*depth, (y*w + x1)*depth)
+            row = bytes(pixels[start:end])
+            if transparent:
+                rows.append(self._masked_row(self._previous[start:end], row))
+            else:
+                rows.append(row)
+            self._previous[start:end] = row
+        self._pending = (changed, b''.join(rows), duration, transparent)
+        return
+
+    def _changed_box(self, pixels, box):
+        """Find the pixel box (x0,y0, x1,y1) of changes to the previous frame.
+
+        Returns:
+            tuple(int,int,int,int): Smallest box containing all changed
+                pixels, or None if nothing changed.
+        """
+        (w, depth, previous) = (self.width, self._depth, self._previous)
+        (x0, y0, x1, y1) = (0, 0, self.width, self.height) if box is None else box
+        (left, top, right, bottom) = (x1, None, x0, None)
+        for y in range(y0, y1):
+            (start, end) = ((y*w + x0)*depth, (y*w + x1)*depth)
+            (old, new) = (previous[start:end], pixels[start:end])
+            if old == new:
+                continue
+            if top is None:
+                top = y
+            bottom = y+1
+            # First and last differing byte from the XOR of the row segments
+            diff = int.from_bytes(old, 'big') ^ int.from_bytes(new, 'big')
+            length = end - start
+            first = length - (diff.bit_length()+7)//8
+            last = length-1 - ((diff & -diff).bit_length()-1)//8
+            left = min(left, x0 + first//depth)
+            right = max(right, x0 + last//depth + 1)
+        return None if top is None else (left, top, right, bottom)
+
+    def _masked_row(self, old, new):
+        """Replace pixels of a row equal to the previous ones by transparency."""
+        length = len(new)
+        same = (
+            (int.from_bytes(old, 'little') ^ int.from_bytes(new, 'little'))
+            .to_bytes(length, 'little').translate(AnimationWriter._SAME_TO_MASK)
+        )
+        mask = int.from_bytes(same, 'little')
+        transparent = int.from_bytes(bytes([self._transparency]) * length, 'little')
+        row = (int.from_bytes(new, 'little') & ~mask) | (transparent & mask)
+        return row.to_bytes(length, 'little')
+
+    def write_image(self, image, duration=None, box=None):
+        """Append a PIL image as frame, see `write_frame`.
+
+        Images of a different palette are mapped to the nearest colors of the
+        writer's palette.
+        """
+        if image.size != (self.width, self.height):
+            raise ValueError(f"image must have size {(self.width, self.height)}, not {image.size}")
+        if self.palette is None:
+            pixels = image.convert('RGB').tobytes()
+        elif image.mode == 'P' and bytes(image.getpalette()) == self._palette_bytes:
+            pixels = image.tobytes()
+        else:
+            if self._palette_image is None:
+                self._palette_image = Image.new('P', (1,1))
+                self._palette_image.putpalette(self._palette_bytes)
+            pixels = image.convert('RGB').quantize(palette=self._palette_image, dither=0).tobytes()
+        self.write_frame(pixels, duration, box)
+        return
+
+    def _write_raw(self, pixels):
+        """Write a frame as RGB pixels."""
+        if self.palette is not None:
+            image = Image.frombytes('P', (self.width, self.height), bytes(pixels))
+            image.putpalette(self._palette_bytes)
+            pixels = image.convert('RGB').tobytes()
+        self._file.write(pixels)
+        self.frame_count += 1
+        return
+
+    def _encode(self, box, pixels, duration, transparent):
+        """Write a (partial) frame to a GIF or APNG file."""
+        (x0, y0, x1, y1) = box
+        size = (x1-x0, y1-y0)
+        if self.format == 'gif':
+            if self.palette is None:
+                image = Image.frombytes('RGB', size, pixels).quantize()
+            else:
+                image = Image.frombytes('P', size, pixels)
+            params = {
+                'duration': min(duration, 655350), # In centiseconds when written
+                'include_color_table': self.palette is None,
+            }
+            if self.delta:
+                params['disposal'] = 1 # Draw next frame over this one
+            if transparent:
+                params['transparency'] = self._transparency
+            self._file.write(b''.join(GifImagePlugin.getdata(image, (x0, y0), **params)))
+        else:
+            (delay_num, delay_den) = (duration, 1000) if duration < 1<<16 else (min(duration//10, 0xFFFF), 100)
+            self._file.write(PNGWriter._chunk(b'fcTL', AnimationWriter._FCTL.pack(
+                self._sequence, *size, x0, y0, delay_num, delay_den, 0, 0
+            )))
+            self._sequence += 1
+            stride = size[0] * self._depth
+            compressor = zlib.compressobj(self._compression_level)
+            # Every row is prefixed by filter type 0 (none)
+            data = b''.join(
+                compressor.compress(b'\0' + pixels[start:start+stride])
+                for start in range(0, len(pixels), stride)
+            ) + compressor.flush()
+            for start in range(0, len(data), PNGWriter._CHUNK_SIZE):
+                piece = data[start:start+PNGWriter._CHUNK_SIZE]
+                if self.frame_count == 0:
+                    self._file.write(PNGWriter._chunk(b'IDAT', piece))
+                else:
+                    self._file.write(PNGWriter._chunk(b'fdAT', struct.pack('>I', self._sequence) + piece))
+                    self._sequence += 1
+        self.frame_count += 1
+        return
+
+    def close(self):
+        """Finish the animation, which must have at least one frame."""
+        if self._pending is not None:
+            self._encode(*self._pending)
+            self._pending = None
+        if self.format != 'raw' and self.frame_count == 0:
+            raise ValueError("Animation must have at least one frame")
+        if self.format == 'gif':
+            self._file.write(b';')
+        elif self.format == 'apng':
+            self._file.write(PNGWriter._chunk(b'IEND', b''))
+            end = self._file.tell()
+            self._file.seek(self._actl_position)
+            self._write_actl()
+            self._file.seek(end)
+        if self._owns_file:
+            self._file.close()
+        return
+
+class MutationLog:
+    """
+    Compact record of the changes made to a maze, split into frames.
+
+    Once attached to a maze, every change to the edges or algorithm id of a
+    cell is stored as an event (cell index, edge delta, algorithm id delta)
+    in flat arrays. Deltas are the XOR of old and new values, so events can
+    be applied forwards as well as backwards (see `MazeReplay`).
+    `record_frame` can be passed to builders in place of a frame callback.
+    """
+
+    def __init__(self, maze):
+        """Attach a new log to a maze, starting from its current state.
+
+        Args:
+            maze (Maze): Maze whose changes to record from now on.
+        """
+        self.width = maze.width
+        self.height = maze.height
+        self.initial_state = maze.to_bytes()
+        self.indices = array.array('I')
+        self.edge_deltas = array.array('B')
+        self.alg_id_deltas = array.array('H')
+        # Number of events that make up the state of each frame
+        self.frame_ends = array.array('Q')
+        maze._log = self
+
+    def __len__(self):
+        """Get the number of frames recorded."""
+        return len(self.frame_ends)
+
+    def _record(self, index, edge_delta, alg_id_delta):
+        """Append an event, as reported by the maze."""
+        self.indices.append(index)
+        self.edge_deltas.append(edge_delta)
+        self.alg_id_deltas.append(alg_id_delta)
+        return
+
+    def record_frame(self, maze=None):
+        """Mark the events so far as a frame.
+
+        Args:
+            maze (Maze): Ignored, for use as a `record_frame` callback.
+        """
+        self.frame_ends.append(len(self.indices))
+        return
+
+class MazeReplay:
+    """
+    Reconstruct the states of a maze from a `MutationLog`.
+
+    The replayed maze is stepped to a frame by applying (or undoing) the
+    events in between. Checkpoints of the maze state (see `Maze.to_bytes`)
+    are taken at frames some events apart, so seeking any frame only replays
+    a bounded number of events, and ranges of frames can be rendered by
+    worker processes each starting from a checkpoint.
+    """
+
+    _CHUNK_FRAMES = 32
+    """Maximum number of frames rendered by a worker process at a time."""
+
+    def __init__(self, log, checkpoint_events=None, checkpoints=None):
+        """Replay a log, starting at its initial state.
+
+        Args:
+            log (MutationLog): Recorded changes.
+            checkpoint_events (int): Minimum number of events between
+                checkpoints (default is the number of cells of the maze).
+            checkpoints (list(tuple(int,bytes))): Event counts and states of
+                checkpoints taken by another replay of the same log (default is
+                None, taking new ones).
+        """
+        self.log = log
+        self.maze = Maze.from_bytes(log.initial_state)
+        self.frame = None # Frame the maze is at, None for the initial state
+        self._position = 0 # Number of events applied
+        if checkpoints is None:
+            if checkpoint_events is None:
+                checkpoint_events = log.width * log.height
+            checkpoints = [(0, log.initial_state)]
+            for end in log.frame_ends:
+                if end - self._position >= checkpoint_events:
+                    self._apply(self._position, end)
+                    self._position = end
+                    checkpoints.append((end, self.maze.to_bytes()))
+            self._restore(*checkpoints[0])
+        self._checkpoints = checkpoints
+        self._checkpoint_positions = [position for (position,_) in checkpoints]
+
+    def __len__(self):
+        """Get the number of frames that can be replayed."""
+        return len(self.log)
+
+    def _apply(self, start, stop):
+        """Apply the events start..stop-1, or undo them if they are applied.
+
+        Events are XOR deltas, so applying and undoing are the same and the
+        order of events does not matter.
+        """
+        (maze, log) = (self.maze, self.log)
+        (edges, alg_ids) = (maze._edges, maze._alg_ids)
+        indices = log.indices[start:stop]
+        events = zip(indices, log.edge_deltas[start:stop], log.alg_id_deltas[start:stop])
+        for (index,edge_delta,alg_id_delta) in events:
+            edges[index] ^= edge_delta
+            alg_ids[index] ^= alg_id_delta
+        maze._path_index = None
+        if maze._dirty is not None:
+            maze._dirty.update(indices)
+        return
+
+    def _restore(self, position, state):
+        """Load a checkpoint into the replayed maze."""
+        restored = Maze.from_bytes(state)
+        self.maze._edges[:] = restored._edges
+        self.maze._alg_ids[:] = restored._alg_ids
+        self.maze._path_index = None
+        self.maze._dirty = None # Trackers have to repaint everything
+        self._position = position
+        return
+
+    def seek(self, frame):
+        """Bring the replayed maze to the state of a frame.
+
+        Args:
+            frame (int): Frame number (negative numbers count from the end).
+
+        Returns:
+            Maze: The replayed maze (the same object every time).
+        """
+        target = self.log.frame_ends[frame]
+        k = bisect.bisect_right(self._checkpoint_positions, target) - 1
+        (position, state) = self._checkpoints[k]
+        if target - position < abs(target - self._position):
+            self._restore(position, state)
+        self._apply(*sorted((self._position, target)))
+        self._position = target
+        self.frame = frame % len(self.log)
+        return self.maze
+
+    def frames(self, frames=None):
+        """Step the replayed maze through frames.
+
+        Args:
+            frames (iterable(int)): Frame numbers (default is all frames).
+
+        Yields:
+            Maze: The replayed maze at each frame.
+        """
+        if frames is None:
+            frames = range(len(self.log))
+        for frame in frames:
+            yield self.seek(frame)
+        return
+
+    def render(self, frames=None, image_generator=None, max_workers=None):
+        """Render frames in parallel by worker processes.
+
+        Frames are split into short chunks of ascending frames (about four
+        per worker, at most `_CHUNK_FRAMES`), and every chunk is rendered by
+        a worker seeking its own replay from the nearest checkpoint (or its
+        previous chunk) and stepping it forward.
+
+        Args:
+            frames (iterable(int)): Frame numbers (default is all frames).
+            image_generator (callable(Maze) -> PIL.Image): A picklable function
+                producing the image of a frame, e.g. a module-level function
+                or `functools.partial` (default is
+                FrameRenderer(wall_air_ratio=(1,3))).
+            max_workers (int): Maximum number of worker processes (default is
+                os.cpu_count()).
+
+        Yields:
+            PIL.Image: Image of every frame, in the order given. At most one
+                chunk per worker is rendered ahead of the frame yielded.
+        """
+        if frames is None:
+            frames = range(len(self.log))
+        if image_generator is None:
+            image_generator = FrameRenderer(wall_air_ratio=(1,3))
+        frames = list(frames)
+        workers = max_workers or os.cpu_count() or 1
+        chunk_size = max(1, min(MazeReplay._CHUNK_FRAMES, -(-len(frames) // (4*workers))))
+        # Split frames into chunks a worker can step through forward
+        chunks = []
+        previous = None
+        for frame in frames:
+            target = self.log.frame_ends[frame]
+            if chunks and len(chunks[-1]) < chunk_size and target >= previous:
+                chunks[-1].append(frame)
+            else:
+                chunks.append([frame])
+            previous = target
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers,
+            initializer=_init_replay_worker,
+            initargs=(self.log, self._checkpoints),
+        ) as executor:
+            # Keep one chunk per worker in flight, so images can't pile up
+            pending = collections.deque()
+            for chunk in chunks:
+                if len(pending) >= workers:
+                    yield from pending.popleft().result()
+                pending.append(executor.submit(_render_replay_frames, chunk, image_generator))
+            while pending:
+                yield from pending.popleft().result()
+        return
+
 # END   CLASSES
 
 
 # BEGIN FUNCTIONS
-# No functions
+
+def eller_rows(width, height, horizontal_probability=0.5, vertical_probability=0.5, packed=True, seed=None):
+    """Generate a perfect maze row by row with Eller's algorithm.
+
+    Only the set labels of the current row are kept, so memory use is
+    O(width) regardless of height and rows can be streamed directly into
+    e.g. `Maze.rows_to_file`.
+
+    Args:
+        width, height (int): Positive integer dimensions of maze.
+        horizontal_probability (float): Probability 0<=p<=1 to join two
+            horizontally adjacent nodes of different sets (default is 0.5).
+        vertical_probability (float): Probability 0<=p<=1 to connect a node
+            downwards, besides one node per set (default is 0.5).
+        packed (bool): Whether to pack rows two nodes per byte like
+            `Maze.to_bytes`, else one node per byte (default is True).
+        seed (int or random.Random): Seed for a new random number generator,
+            or generator to use directly (default is drawn from `random`).
+
+    Yields:
+        bytes: Edges of the next row of nodes.
+    """
+    if not (width > 0 and height > 0):
+        raise ValueError("Maze must have positive width and height")
+    if isinstance(seed, random.Random):
+        rng = seed
+    else:
+        rng = random.Random(random.getrandbits(64) if seed is None else seed)
+    # Set labels of current row: < width if carried down from the row above,
+    # width+x for a new set
+    labels = array.array('l', range(width, 2*width))
+    up_edges = bytearray(width)
+    for y in range(height):
+        is_last_row = (y == height-1)
+        row = bytearray(up_edges)
+        # Disjoint-set forest over labels (with path halving)
+        parent = array.array('l', range(2*width))
+        roots = array.array('l', labels)
+        for x in range(width):
+            root = roots[x]
+            while parent[root] != root:
+                parent[root] = root = parent[parent[root]]
+            roots[x] = root
+        # Randomly join adjacent sets, all of them in the last row
+        for x in range(width-1):
+            root0 = roots[x]
+            while parent[root0] != root0:
+                parent[root0] = root0 = parent[parent[root0]]
+            root1 = roots[x+1]
+            while parent[root1] != root1:
+                parent[root1] = root1 = parent[parent[root1]]
+            if root0 != root1 and (is_last_row or rng.random() < horizontal_probability):
+                parent[root1] = root0
+                row[x] |= RIGHT
+                row[x+1] |= LEFT
+        if not is_last_row:
+            # Carry every set down at least once
+            members = collections.defaultdict(list)
+            for x in range(width):
+                root = roots[x]
+                while parent[root] != root:
+                    parent[root] = root = parent[parent[root]]
+                members[root].append(x)
+            up_edges = bytearray(width)
+            labels = array.array('l', range(width, 2*width))
+            for (label,xs) in enumerate(members.values()):
+                down_xs = [x for x in xs if rng.random() < vertical_probability]
+                for x in down_xs or [rng.choice(xs)]:
+                    row[x] |= DOWN
+                    up_edges[x] = UP
+                    labels[x] = label
+        yield Maze._pack_nibbles(row) if packed else bytes(row)
+    return
+
+_replay_worker = None
+"""Replay used by a `MazeReplay.render` worker process."""
+
+def _init_replay_worker(log, checkpoints):
+    """Set up the replay of a `MazeReplay.render` worker process."""
+    global _replay_worker
+    _replay_worker = MazeReplay(log, checkpoints=checkpoints)
+    return
+
+def _render_replay_frames(frames, image_generator):
+    """Render a chunk of frames of `MazeReplay.render` (worker process)."""
+    return [image_generator(_replay_worker.seek(frame)) for frame in frames]
+
+_tile_worker_maze = None
+"""Maze rendered by a `Maze.to_tiles` worker process."""
+
+def _init_tile_worker(data):
+    """Load the maze of a `Maze.to_tiles` worker process from binary data."""
+    global _tile_worker_maze
+    _tile_worker_maze = Maze.from_bytes(data)
+    return
+
+def _render_tile_block(spec, z, x, y):
+    """Render a subtree of `Maze.to_tiles` (worker process), see `_render_tile`."""
+    return _render_tile(_tile_worker_maze, spec, z, x, y)
+
+def _render_tile(maze, spec, z, x, y, rendered=None):
+    """Render and write a tile of `Maze.to_tiles` with all tiles below it.
+
+    Args:
+        maze (Maze): Maze to render.
+        spec (dict): Tile pyramid description made by `Maze.to_tiles`.
+        z, x, y (int): Zoom level and position of tile.
+        rendered (tuple(int,dict)): Zoom level and tile data of tiles which
+            were already rendered, by position (default is None).
+
+    Returns:
+        list(bytes): Pixel rows of the tile.
+    """
+    if rendered is not None and rendered[0] == z:
+        return rendered[1][(x,y)]
+    tile_size = spec['tile_size']
+    level_sizes = spec['level_sizes']
+    (level_width, level_height) = level_sizes[z]
+    (px0, py0) = (x*tile_size, y*tile_size)
+    (px1, py1) = (min(px0+tile_size, level_width), min(py0+tile_size, level_height))
+    if z == len(level_sizes)-1:
+        # Render lattice area covering tile, with a margin for shared walls
+        (wallM, airM) = spec['wall_air_ratio']
+        period = wallM + airM
+        (w, h) = (maze.width, maze.height)
+        (x0, y0) = (max(0, px0//period - 1), max(0, py0//period - 1))
+        (x1, y1) = (min(w-1, px1//period + 1), min(h-1, py1//period + 1))
+        aw = x1-x0+1
+        pixel_rows = Maze._pixel_rows(
+            aw, y1-y0+1,
+            (maze._edges[ay*w+x0:ay*w+x0+aw].tobytes() for ay in range(y0,y1+1)),
+            spec['wall_air_ratio'],
+            spec['decolumnated'],
+            packed=False,
+            wall_air_indices=(0,255),
+        )
+        (offset_x, offset_y) = (x0*period, y0*period)
+        rows = []
+        for (pixels,repeat) in pixel_rows:
+            # Keep the part of this run of rows overlapping the tile
+            count = min(offset_y+repeat, py1) - max(offset_y, py0)
+            if count > 0:
+                rows += [bytes(pixels[px0-offset_x:px1-offset_x])] * count
+            offset_y += repeat
+            if offset_y >= py1:
+                break
+    else:
+        # Downsample the (up to four) children by averaging 2x2 pixel blocks
+        (child_width, child_height) = level_sizes[z+1]
+        child_columns = -(-child_width // tile_size)
+        child_rows = -(-child_height // tile_size)
+        source = []
+        for cy in (2*y, 2*y+1):
+            if cy < child_rows:
+                children = [
+                    _render_tile(maze, spec, z+1, cx, cy, rendered)
+                    for cx in (2*x, 2*x+1) if cx < child_columns
+                ]
+                source += [b''.join(parts) for parts in zip(*children)]
+        if len(source[0]) % 2:
+            source = [row + row[-1:] for row in source]
+        if len(source) % 2:
+            source.append(source[-1])
+        rows = [
+            bytes(
+                (a+b+c+d+2) >> 2 for (a,b,c,d)
+                in zip(row0[0::2], row0[1::2], row1[0::2], row1[1::2])
+            )
+            for (row0,row1) in zip(source[0::2], source[1::2])
+        ]
+    _write_tile(spec, z, x, y, rows)
+    return rows
+
+def _write_tile(spec, z, x, y, rows):
+    """Write a tile of `Maze.to_tiles`, deduplicated by content hash."""
+    directory = spec['directory']
+    digest = hashlib.sha1(b''.join(rows)).hexdigest()
+    hashed_path = os.path.join(directory, '_hashed', f"{len(rows[0])}x{len(rows)}_{digest}.png")
+    if not os.path.exists(hashed_path):
+        # Other processes may write the same tile, so only publish complete files
+        temporary_path = f"{hashed_path}.{os.getpid()}"
+        with PNGWriter(temporary_path, len(rows[0]), len(rows), spec['palette']) as png:
+            for row in rows:
+                png.write_row(row)
+        os.replace(temporary_path, hashed_path)
+    path = os.path.join(directory, str(z), str(x), f"{y}.png")
+    if os.path.lexists(path):
+        os.remove(path)
+    try:
+        os.link(hashed_path, path)
+    except OSError:
+        shutil.copyfile(hashed_path, path)
+    return
+
+def _carve_tile(edges_name, alg_ids_name, area_width, tile, algorithm_name, seed):
+    """Carve one tile of `Maze.tiled` into shared memory (worker process).
+
+    Args:
+        edges_name, alg_ids_name (str): Names of the shared memory blocks
+            holding the area's edges (bytes) and algorithm ids (16-bit).
+        area_width (int): Width of the area the shared memory covers.
+        tile (tuple(int,int,int,int)): Tile corners in area coordinates.
+        algorithm_name (str): Name of algorithm in ALGORITHMS to carve with.
+        seed (int): Seed for the algorithm.
+    """
+    (tx0,ty0,tx1,ty1) = tile
+    (tw, th) = (tx1-tx0+1, ty1-ty0+1)
+    maze = Maze(tw, th)
+    ALGORITHMS[algorithm_name](maze, seed=seed)
+    edges_memory = shared_memory.SharedMemory(name=edges_name)
+    alg_ids_memory = shared_memory.SharedMemory(name=alg_ids_name)
+    try:
+        for y in range(th):
+            index = (ty0+y)*area_width + tx0
+            edges_memory.buf[index:index+tw] = maze._edges[y*tw:(y+1)*tw]
+            alg_ids_memory.buf[2*index:2*(index+tw)] = maze._alg_ids[y*tw:(y+1)*tw].tobytes()
+    finally:
+        edges_memory.close()
+        alg_ids_memory.close()
+    return
+
 # END   FUNCTIONS
 
 
@@ -14,8 +14,8 @@ Help menu shown upon execution:
  ;  help   - show this menu
  Mazebuilding
  ;  build  - make new maze
- :  store  - store maze to  temp.txt
- :  load   - load maze from temp.txt
+ :  store  - store maze to  file
+ :  load   - load maze from file
  :  join   - join (remove) dead ends
  Maze Settings
  :  dim    - set dimensions for next build
@@ -46,12 +46,13 @@ Help menu shown upon execution:
 
 # BEGIN IMPORTS
 
-from os         import makedirs
+import functools # partial
+from os         import makedirs, replace
 from shutil     import get_terminal_size
 
 from benchtools import timed, timed_titled
 import colortools as ct
-from mazing     import Maze, ALGORITHMS
+from mazing     import Maze, ALGORITHMS, FrameRenderer, AnimationWriter
 
 # END   IMPORTS
 
@@ -64,7 +65,7 @@ CANCEL_TEXT = "*canceled\n" # When cancling out of a menu
 CELL_PRINT_LIMIT = 10_000 # Max cell count before maze gets stopped from printing
 IMAGE_DIRECTORY = 'images'
 ANIMATION_DIRECTORY = 'animations'
-MAZE_STORAGE_FILE = 'maze_store.dat'
+MAZE_STORAGE_FILE = 'maze_store.maze'
 
 # END   CONSTANTS
 
@@ -345,6 +346,65 @@ def maybe_get_new_ms(old_ms):
         return None
     return new_ms
 
+# Animation frame generators, module-level so worker processes can use them
+
+def animation_image(maze, ratio, colormap_name):
+    """Generate a plain animation frame of a maze."""
+    return maze.generate_image(
+        wall_air_colors=(ct.WHITE,ct.BLACK),
+        raster=maze.generate_raster(
+            wall_air_ratio=ratio
+        )
+    )
+
+def animation_solutionimage(maze, ratio, colormap_name):
+    """Generate an animation frame of a maze and its solution."""
+    maze.compute_solution()
+    return maze.generate_solutionimage(
+        raster=maze.generate_raster(
+            show_solution=True,
+            wall_air_ratio=ratio
+        )
+    )
+
+def animation_distanceimage(maze, ratio, colormap_name):
+    """Generate an animation frame of a maze colored by entrance distance."""
+    maze.compute_distances()
+    return maze.generate_colorimage(
+        gradient_colors=ct.COLORMAPS[colormap_name][::-1],
+        raster=maze.generate_raster(
+            show_distances=True,
+            decolumnated=True,
+            wall_air_ratio=ratio
+        )
+    )
+
+def animation_branchdistanceimage(maze, ratio, colormap_name):
+    """Generate an animation frame of a maze colored by branch distance."""
+    maze.compute_branchdistances()
+    return maze.generate_colorimage(
+        gradient_colors=ct.COLORMAPS[colormap_name][::-1],
+        raster=maze.generate_raster(
+            show_distances=True,
+            decolumnated=True,
+            wall_air_ratio=ratio
+        )
+    )
+
+def animation_algorithmimage(maze, ratio, colormap_name):
+    """Generate an animation frame of a maze colored by algorithm."""
+    return maze.generate_algorithmimage(
+        raster=maze.generate_raster(
+            show_algorithms=True,
+            wall_air_ratio=ratio
+        )
+    )
+
+def run_builder(maze, record_frame, builder_name):
+    """Build a maze by name for `Maze.generate_animation`."""
+    ALGORITHMS[builder_name](maze, record_frame=record_frame)
+    return
+
 def animation_helper():
     """Run console routine to assist in the creation of maze animations.
 
@@ -359,55 +419,13 @@ def animation_helper():
     ms  = 30
     builder_name = 'backtracker'
     image_generator_name = 'img'
-    image_generators = { #### color,ratio
-        'img': (lambda maze:
-            maze.generate_image(
-                wall_air_colors=(ct.WHITE,ct.BLACK),
-                raster=maze.generate_raster(
-                    wall_air_ratio=ratio
-                )
-            )
-        ),
-        'imgsol': (lambda maze:
-            maze.compute_solution()
-            and()or maze.generate_solutionimage(
-                raster=maze.generate_raster(
-                    show_solution=True,
-                    wall_air_ratio=ratio
-                )
-            )
-        ),
-        'imgdst': (lambda maze:
-            maze.compute_distances()
-            and()or maze.generate_colorimage(
-                gradient_colors=ct.COLORMAPS[colormap_name][::-1],
-                raster=maze.generate_raster(
-                    show_distances=True,
-                    decolumnated=True,
-                    wall_air_ratio=ratio
-                )
-            )
-        ),
+    image_generators = {
+        'img': animation_image,
+        'imgsol': animation_solutionimage,
+        'imgdst': animation_distanceimage,
         # TODO: Implement `imgpth`.
-        'imgbrc': (lambda maze:
-            maze.compute_branchdistances()
-            and()or maze.generate_colorimage(
-                gradient_colors=ct.COLORMAPS[colormap_name][::-1],
-                raster=maze.generate_raster(
-                    show_distances=True,
-                    decolumnated=True,
-                    wall_air_ratio=ratio
-                )
-            )
-        ),
-        'imgalg': (lambda maze:
-            maze.generate_algorithmimage(
-                raster=maze.generate_raster(
-                    show_algorithms=True,
-                    wall_air_ratio=ratio
-                )
-            )
-        ),
+        'imgbrc': animation_branchdistanceimage,
+        'imgalg': animation_algorithmimage,
     }
     helper_text = lambda: dedent4_concat_strip(
         f"""
@@ -431,7 +449,7 @@ def animation_helper():
          ;    = {ms}
          :  onlyfr  - only record n-th frame
          ;    = {only}
-         Expected resolution       = {1+dimensions[0]*sum(ratio)} x {1+dimensions[1]*sum(ratio)}
+         Expected resolution       = {ratio[0]+dimensions[0]*sum(ratio)} x {ratio[0]+dimensions[1]*sum(ratio)}
          Expected number of frames = {dimensions[0]*dimensions[1] // only}
          Expected animation length = {ms * (dimensions[0]*dimensions[1] // only) / 1000:.02f}s
         ~:--------------------------------------:~
@@ -495,23 +513,39 @@ def animation_helper():
             # Build maze->animation
             case 'start':
                 makedirs(ANIMATION_DIRECTORY, exist_ok=True)
-                (frames, maze) = timed(Maze.generate_animation)(
-                    *dimensions,
-                    maze_runner=(lambda maze, record_frame:
-                        ALGORITHMS[builder_name](maze, record_frame=record_frame)
-                    ),
-                    image_generator=image_generators[image_generator_name],
-                    frame_only=only,
-                    alert_progress_steps=10,
-                )
-                timed_titled(f"saving {frames[0].filename}", frames[0].save)(
-                    f"{ANIMATION_DIRECTORY}/{frames[0].filename}",
-                    save_all=True,
-                    append_images=frames[1:],
-                    optimize=False,
-                    duration=ms,
-                    #loop=0,
-                )
+                if image_generator_name == 'img':
+                    # Only repaints changed cells, frames need no conversion
+                    image_generator = FrameRenderer(
+                        wall_air_ratio=ratio,
+                        wall_air_colors=(ct.WHITE,ct.BLACK)
+                    )
+                    palette = image_generator.wall_air_colors
+                    parallel = False
+                else:
+                    image_generator = functools.partial(
+                        image_generators[image_generator_name],
+                        ratio=ratio,
+                        colormap_name=colormap_name,
+                    )
+                    palette = None
+                    # Frames are rendered from scratch, so spread them over processes
+                    parallel = True
+                size = [ratio[0] + d*sum(ratio) for d in dimensions]
+                path = f"{ANIMATION_DIRECTORY}/recording.gif"
+                # Frames are encoded as they are recorded
+                with AnimationWriter(path, *size, palette=palette, duration=ms, loop=None, delta=True) as writer:
+                    (_, maze) = timed(Maze.generate_animation)(
+                        *dimensions,
+                        maze_runner=functools.partial(run_builder, builder_name=builder_name),
+                        image_generator=image_generator,
+                        frame_only=only,
+                        alert_progress_steps=10,
+                        writer=writer,
+                        parallel=parallel,
+                    )
+                filename = f"{maze.name()}_anim_{maze._stamp()}.gif"
+                replace(path, f"{ANIMATION_DIRECTORY}/{filename}")
+                print(f"saved {filename}")
             case _:
                 print("Unrecognized option")
         print(helper_text())
@@ -766,8 +800,8 @@ def playground():
          ;  help   - show this menu
          Mazebuilding
          ;  build  - make new maze
-         :  store  - store maze to  temp.txt
-         :  load   - load maze from temp.txt
+         :  store  - store maze to  file
+         :  load   - load maze from file
          :  join   - join (remove) dead ends
          Maze Settings
          :  dim    - set dimensions for next build
@@ -917,12 +951,7 @@ def playground():
             # Load maze from temporary storage file
             case 'load':
                 try:
-                    with open(MAZE_STORAGE_FILE,'r') as file:
-                        string = timed_titled("reading file", file.read)()
-                    data = timed_titled("evaluating string", eval)(string)
-                    maze = timed_titled("loading maze", Maze.from_repr)(data)
-                    #with open(maze_storage_file,'rb') as file:
-                        #maze = pickle.load(file)
+                    maze = timed_titled("loading maze", Maze.from_file)(MAZE_STORAGE_FILE)
                     preview(maze)
                 except Exception as e:
                     print(f"[could not load maze: {e}]")
@@ -956,11 +985,7 @@ def playground():
                 print(stats_text)
             # Store maze to temporary storage file
             case 'store':
-                with open(MAZE_STORAGE_FILE,'w') as file:
-                    data = timed_titled("generating string", repr)(maze)
-                    timed_titled("storing file", file.write)(data)
-                #with open(MAZE_STORAGE_FILE,'wb') as file:
-                    #pickle.dump(maze, file, pickle.HIGHEST_PROTOCOL)
+                timed_titled("storing maze", maze.to_file)(MAZE_STORAGE_FILE)
             # Re-open last image shown for preview
             case 'view':
                 if image is None: